@@ -0,0 +1,41 @@
+"""Notify meetings_ready channel when a meeting is ready for insights
+
+Revision ID: a1e5c7d9f3b4
+Revises: f7d4a9b5c1e3
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a1e5c7d9f3b4'
+down_revision = 'f7d4a9b5c1e3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Wake the meeting insights worker (LISTEN meetings_ready) when a bot session ends.
+    # Statuses match INSIGHTS_TARGET_STATUSES as set in docker-compose.yml
+    # (completed,failed); the worker's code default is only 'completed'. A wakeup
+    # for a status the worker does not target is harmless, and statuses outside
+    # this list are still picked up by its polling fallback.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_meetings_ready() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('meetings_ready', NEW.id::text);
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER meetings_notify_ready
+        AFTER UPDATE OF status ON meetings
+        FOR EACH ROW
+        WHEN (NEW.status IN ('completed', 'failed') AND OLD.status IS DISTINCT FROM NEW.status)
+        EXECUTE FUNCTION notify_meetings_ready();
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS meetings_notify_ready ON meetings")
+    op.execute("DROP FUNCTION IF EXISTS notify_meetings_ready()")
@@ -0,0 +1,37 @@
+"""Notify jira_sync channel when meeting insights are completed
+
+Revision ID: a7c4e1f9b2d3
+Revises: e8f9a2b4c5d6
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7c4e1f9b2d3'
+down_revision = 'e8f9a2b4c5d6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Wake the Jira sync worker (LISTEN jira_sync) as soon as insights are ready
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_jira_sync() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('jira_sync', NEW.id::text);
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER meetings_notify_jira_sync
+        AFTER UPDATE OF summary_state ON meetings
+        FOR EACH ROW
+        WHEN (NEW.summary_state = 'completed' AND OLD.summary_state IS DISTINCT FROM 'completed')
+        EXECUTE FUNCTION notify_jira_sync();
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS meetings_notify_jira_sync ON meetings")
+    op.execute("DROP FUNCTION IF EXISTS notify_jira_sync()")
@@ -0,0 +1,28 @@
+"""Add partial index for meetings pending Jira sync
+
+Revision ID: b3e8d5a1c7f2
+Revises: a7c4e1f9b2d3
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3e8d5a1c7f2'
+down_revision = 'a7c4e1f9b2d3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves the Jira sync worker's pending-meeting query without locking writes on meetings
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_meeting_jira_sync_pending
+            ON meetings ((data->>'jira_sync_state'))
+            WHERE summary_state = 'completed' AND data ? 'insights_ru'
+        """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_meeting_jira_sync_pending")
@@ -0,0 +1,33 @@
+"""Make (meeting_id, chunk_hash) unique on transcript_embeddings
+
+Revision ID: c3a7e9f1b5d6
+Revises: b2f6d8e0a4c5
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3a7e9f1b5d6'
+down_revision = 'b2f6d8e0a4c5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Older runs could store the same chunk twice; keep the first copy
+    op.execute("""
+        DELETE FROM transcript_embeddings a
+        USING transcript_embeddings b
+        WHERE a.meeting_id = b.meeting_id
+          AND a.chunk_hash = b.chunk_hash
+          AND a.id > b.id
+    """)
+    op.create_unique_constraint(
+        '_meeting_chunk_hash_uc',
+        'transcript_embeddings',
+        ['meeting_id', 'chunk_hash'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('_meeting_chunk_hash_uc', 'transcript_embeddings', type_='unique')
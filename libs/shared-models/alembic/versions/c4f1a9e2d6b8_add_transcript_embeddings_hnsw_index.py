@@ -0,0 +1,28 @@
+"""Add HNSW index for transcript embedding similarity search
+
+Revision ID: c4f1a9e2d6b8
+Revises: b3e8d5a1c7f2
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4f1a9e2d6b8'
+down_revision = 'b3e8d5a1c7f2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Approximate nearest-neighbour search for RAG (cosine distance), built without blocking writes
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transcript_embeddings_hnsw
+            ON transcript_embeddings USING hnsw (embedding vector_cosine_ops)
+            WITH (m = 16, ef_construction = 64)
+        """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_transcript_embeddings_hnsw")
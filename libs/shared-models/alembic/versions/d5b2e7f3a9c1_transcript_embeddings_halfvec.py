@@ -0,0 +1,40 @@
+"""Store transcript embeddings as halfvec (FP16)
+
+Revision ID: d5b2e7f3a9c1
+Revises: c4f1a9e2d6b8
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5b2e7f3a9c1'
+down_revision = 'c4f1a9e2d6b8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # halfvec needs pgvector >= 0.7; the HNSW index is rebuilt for the new opclass
+    op.execute("DROP INDEX IF EXISTS ix_transcript_embeddings_hnsw")
+    op.execute("""
+        ALTER TABLE transcript_embeddings
+        ALTER COLUMN embedding TYPE halfvec(1536) USING embedding::halfvec(1536)
+    """)
+    op.execute("""
+        CREATE INDEX ix_transcript_embeddings_hnsw
+        ON transcript_embeddings USING hnsw (embedding halfvec_cosine_ops)
+        WITH (m = 16, ef_construction = 64)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_transcript_embeddings_hnsw")
+    op.execute("""
+        ALTER TABLE transcript_embeddings
+        ALTER COLUMN embedding TYPE vector(1536) USING embedding::vector(1536)
+    """)
+    op.execute("""
+        CREATE INDEX ix_transcript_embeddings_hnsw
+        ON transcript_embeddings USING hnsw (embedding vector_cosine_ops)
+        WITH (m = 16, ef_construction = 64)
+    """)
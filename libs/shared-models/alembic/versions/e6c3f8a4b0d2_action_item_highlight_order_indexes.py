@@ -0,0 +1,32 @@
+"""Add per-meeting ordering indexes for action items and speaker highlights
+
+Revision ID: e6c3f8a4b0d2
+Revises: d5b2e7f3a9c1
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e6c3f8a4b0d2'
+down_revision = 'd5b2e7f3a9c1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serve "WHERE meeting_id IN (...) ORDER BY ..." of the ordered relationships from the index
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_action_items_meeting_due
+            ON action_items (meeting_id, due_date NULLS LAST)
+        """)
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_speaker_highlights_meeting_start
+            ON speaker_highlights (meeting_id, start_time)
+        """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_speaker_highlights_meeting_start")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_action_items_meeting_due")
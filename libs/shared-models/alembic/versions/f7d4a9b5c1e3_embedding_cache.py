@@ -0,0 +1,30 @@
+"""Add embedding_cache table keyed by (model, text hash)
+
+Revision ID: f7d4a9b5c1e3
+Revises: e6c3f8a4b0d2
+"""
+from alembic import op
+import sqlalchemy as sa
+from pgvector.sqlalchemy import HALFVEC
+
+
+# revision identifiers, used by Alembic.
+revision = 'f7d4a9b5c1e3'
+down_revision = 'e6c3f8a4b0d2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'embedding_cache',
+        sa.Column('model', sa.String(length=100), nullable=False),
+        sa.Column('text_hash', sa.String(length=64), nullable=False),
+        sa.Column('embedding', HALFVEC(1536), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint('model', 'text_hash'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('embedding_cache')
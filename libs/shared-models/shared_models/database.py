@@ -1,5 +1,7 @@
 import os
 import logging
+
+import orjson
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy import create_engine # For sync engine if needed for migrations later
@@ -50,8 +52,27 @@ async_session_local = sessionmaker(
     expire_on_commit=False,
 )
 
-# --- Sync Engine (For Alembic migrations) ---
-sync_engine = create_engine(DATABASE_URL_SYNC)
+
+def _json_dumps(value) -> str:
+    # OPT_NON_STR_KEYS keeps stdlib behaviour for int keys in JSON/JSONB dicts
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# --- Sync Engine (Alembic migrations, workers and the Streamlit UI) ---
+# Bounded pool; pre-ping drops connections the server closed while idle and
+# pool_recycle retires long-lived ones before a proxy/server timeout does.
+# Behind PgBouncer in transaction mode set DB_POOL_PRE_PING=false and a short DB_POOL_RECYCLE.
+# JSON/JSONB columns (meeting.data with insights) go through orjson.
+sync_engine = create_engine(
+    DATABASE_URL_SYNC,
+    pool_size=int(os.environ.get("DB_POOL_SIZE", "5")),
+    max_overflow=int(os.environ.get("DB_MAX_OVERFLOW", "10")),
+    pool_recycle=int(os.environ.get("DB_POOL_RECYCLE", "1800")),
+    pool_timeout=int(os.environ.get("DB_POOL_TIMEOUT", "30")),
+    pool_pre_ping=os.environ.get("DB_POOL_PRE_PING", "true").lower() == "true",
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
+)
 
 # --- FastAPI Dependency --- 
 async def get_db() -> AsyncSession:
@@ -17,7 +17,7 @@ from sqlalchemy.ext.mutable import MutableDict
 from datetime import datetime # Needed for Transcription model default
 from shared_models.schemas import Platform # Import Platform for the static method
 from typing import Optional # Added for the return type hint in constructed_meeting_url
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import HALFVEC
 
 # Define the base class for declarative models
 Base = declarative_base()
@@ -65,8 +65,19 @@ class Meeting(Base):
     transcriptions = relationship("Transcription", back_populates="meeting")
     sessions = relationship("MeetingSession", back_populates="meeting", cascade="all, delete-orphan")
     metadata_record = relationship("MeetingMetadata", back_populates="meeting", uselist=False, cascade="all, delete-orphan")
-    speaker_highlights = relationship("SpeakerHighlight", back_populates="meeting", cascade="all, delete-orphan")
-    action_items = relationship("ActionItem", back_populates="meeting", cascade="all, delete-orphan")
+    # Collections load in display order; served by the (meeting_id, ...) indexes below
+    speaker_highlights = relationship(
+        "SpeakerHighlight",
+        back_populates="meeting",
+        cascade="all, delete-orphan",
+        order_by="SpeakerHighlight.start_time",
+    )
+    action_items = relationship(
+        "ActionItem",
+        back_populates="meeting",
+        cascade="all, delete-orphan",
+        order_by="ActionItem.due_date.asc().nulls_last()",
+    )
     transcript_embeddings = relationship("TranscriptEmbedding", back_populates="meeting", cascade="all, delete-orphan")
 
     # Add composite index for efficient lookup by user, platform, and native ID, including created_at for sorting
@@ -79,6 +90,12 @@ class Meeting(Base):
             'created_at' # Include created_at because the query orders by it
         ),
         Index('ix_meeting_data_gin', 'data', postgresql_using='gin'),
+        # Meetings waiting for Jira sync (see jira-sync-worker select_next_meetings)
+        Index(
+            'ix_meeting_jira_sync_pending',
+            text("(data->>'jira_sync_state')"),
+            postgresql_where=text("summary_state = 'completed' AND data ? 'insights_ru'"),
+        ),
         # Optional: Unique constraint (uncomment if needed, ensure native_meeting_id cannot be NULL if unique)
         # UniqueConstraint('user_id', 'platform', 'platform_specific_id', name='_user_platform_native_id_uc'),
     )
@@ -165,6 +182,8 @@ class SpeakerHighlight(Base):
 
     meeting = relationship("Meeting", back_populates="speaker_highlights")
 
+    __table_args__ = (Index('ix_speaker_highlights_meeting_start', 'meeting_id', 'start_time'),)
+
 
 class ActionItem(Base):
     __tablename__ = "action_items"
@@ -182,6 +201,10 @@ class ActionItem(Base):
 
     meeting = relationship("Meeting", back_populates="action_items")
 
+    __table_args__ = (
+        Index('ix_action_items_meeting_due', 'meeting_id', text('due_date NULLS LAST')),
+    )
+
 
 class TranscriptEmbedding(Base):
     __tablename__ = "transcript_embeddings"
@@ -193,7 +216,7 @@ class TranscriptEmbedding(Base):
     speaker = Column(String(255), nullable=True)
     text = Column(Text, nullable=False)
     timestamp = Column(sqlalchemy.DateTime(timezone=True), nullable=True)
-    embedding = Column(Vector(1536), nullable=False)
+    embedding = Column(HALFVEC(1536), nullable=False)  # FP16: half the size of vector(1536)
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
     # RAG-specific columns
     chunk_type = Column(String(50), nullable=True, server_default='transcript', index=True)  # transcript, insight, action_item
@@ -205,3 +228,36 @@ class TranscriptEmbedding(Base):
     meeting_date = Column(sqlalchemy.Date, nullable=True, index=True)
 
     meeting = relationship("Meeting", back_populates="transcript_embeddings")
+
+    __table_args__ = (
+        # Upsert target for the worker: one row per chunk of a meeting
+        UniqueConstraint('meeting_id', 'chunk_hash', name='_meeting_chunk_hash_uc'),
+        # ANN index for cosine similarity search (see shared_models.rag.fetch_chunks)
+        Index(
+            'ix_transcript_embeddings_hnsw',
+            'embedding',
+            postgresql_using='hnsw',
+            postgresql_with={'m': 16, 'ef_construction': 64},
+            postgresql_ops={'embedding': 'halfvec_cosine_ops'},
+        ),
+    )
+
+
+class EmbeddingCache(Base):
+    """Embeddings by content hash, so re-processed or repeated texts skip the API."""
+    __tablename__ = "embedding_cache"
+
+    model = Column(String(100), primary_key=True)
+    text_hash = Column(String(64), primary_key=True)  # sha256 hex of the embedded text
+    embedding = Column(HALFVEC(1536), nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+
+
+class InsightsCache(Base):
+    """Summary model output by prompt hash, so re-runs of an unchanged meeting skip the LLM."""
+    __tablename__ = "insights_cache"
+
+    key = Column(String(64), primary_key=True)  # sha256 hex of model + prompt messages
+    model = Column(String(100), nullable=False)
+    insights = Column(JSONB, nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
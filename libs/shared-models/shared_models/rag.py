@@ -32,6 +32,7 @@ class Chunk:
     language: Optional[str]
     topics: Optional[List[str]]
     similarity_score: float
+    timestamp_iso: Optional[str] = None  # timestamp.isoformat(), computed once in fetch_chunks
 
 
 def compute_chunk_hash(text: str, meeting_id: int, chunk_type: str) -> str:
@@ -45,6 +46,7 @@ def fetch_chunks(
     query_embedding: List[float],
     limit: int = 8,
     filters: Optional[Dict[str, Any]] = None,
+    ef_search: Optional[int] = None,
 ) -> List[Chunk]:
     """
     Retrieve relevant transcript chunks using semantic search.
@@ -63,6 +65,9 @@ def fetch_chunks(
             - date_from: Filter by meeting date (inclusive)
             - date_to: Filter by meeting date (inclusive)
             - exclude_meeting_ids: List of meeting IDs to exclude
+        ef_search: HNSW candidate list size for this query (hnsw.ef_search);
+            larger values improve recall with selective filters. Not used when
+            filtering by meeting_id(s): those queries are ranked exactly
     
     Returns:
         List of Chunk objects ordered by similarity (highest first)
@@ -71,7 +76,8 @@ def fetch_chunks(
         filters = {}
     
     # Build base query with cosine similarity
-    similarity_expr = (1 - TranscriptEmbedding.embedding.cosine_distance(query_embedding)).label('similarity')
+    distance_expr = TranscriptEmbedding.embedding.cosine_distance(query_embedding)
+    similarity_expr = (1 - distance_expr).label('similarity')
     query = select(
         TranscriptEmbedding,
         similarity_expr
@@ -116,8 +122,23 @@ def fetch_chunks(
     if conditions:
         query = query.where(and_(*conditions))
     
-    # Order by similarity (descending) and limit - use text() to reference the label
-    query = query.order_by(text('similarity DESC')).limit(limit)
+    exact = 'meeting_id' in filters or 'meeting_ids' in filters
+    if exact:
+        # Meeting-scoped: filters on an HNSW scan apply only after it returns its
+        # ef_search candidates, which may hold few or none of this meeting's rows.
+        # "+ 0" keeps the planner off the HNSW index, so the meeting's rows are
+        # read via the (meeting_id, chunk_hash) index and ranked exactly.
+        query = query.order_by(distance_expr + 0).limit(limit)
+    else:
+        # Order by distance (ascending) and limit - this form can use the HNSW index
+        query = query.order_by(distance_expr).limit(limit)
+    
+    if ef_search and not exact:
+        # Transaction-local, like SET LOCAL (SET itself cannot take bind parameters)
+        session.execute(
+            text("SELECT set_config('hnsw.ef_search', :ef_search, true)"),
+            {"ef_search": str(ef_search)},
+        )
     
     # Execute query
     results = session.execute(query).all()
@@ -144,6 +165,7 @@ def fetch_chunks(
             start_time=embedding_row.segment_start,
             end_time=embedding_row.segment_end,
             timestamp=embedding_row.timestamp,
+            timestamp_iso=embedding_row.timestamp.isoformat() if embedding_row.timestamp else None,
             chunk_type=embedding_row.chunk_type or 'transcript',
             language=embedding_row.language,
             topics=embedding_row.topics,
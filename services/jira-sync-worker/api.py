@@ -1,9 +1,11 @@
 """HTTP API for triggering Jira sync"""
 import logging
 import os
-import threading
+from contextlib import asynccontextmanager
 from typing import Optional
+import anyio.to_thread
 from fastapi import FastAPI, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from main import sync_meeting_by_id
@@ -14,7 +16,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger("jira_sync_api")
 
-app = FastAPI(title="Jira Sync Worker API")
+# Background syncs are blocking Jira HTTP calls run on the AnyIO thread pool
+# (40 threads by default); allow more of them to wait on Jira concurrently.
+THREADPOOL_SIZE = int(os.environ.get("JIRA_SYNC_THREADPOOL_SIZE", "64"))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Raise the thread limit used for sync routes and background tasks
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    yield
+
+
+app = FastAPI(title="Jira Sync Worker API", default_response_class=ORJSONResponse, lifespan=lifespan)
 
 
 class JiraSyncTriggerRequest(BaseModel):
@@ -33,7 +33,11 @@ PRIORITY_MAPPING = {
 # Worker Configuration
 POLL_INTERVAL = int(os.environ.get("JIRA_SYNC_POLL_INTERVAL", "60"))  # seconds
 BATCH_SIZE = int(os.environ.get("JIRA_SYNC_BATCH_SIZE", "1"))
+BATCH_CONCURRENCY = int(os.environ.get("JIRA_SYNC_BATCH_CONCURRENCY", "4"))  # meetings synced in parallel
+JIRA_SYNC_WORKERS = int(os.environ.get("JIRA_SYNC_WORKERS", "8"))  # parallel bulk-create requests
 DRY_RUN = os.environ.get("JIRA_DRY_RUN", "false").lower() == "true"
+# A 'processing' claim older than this is treated as abandoned and picked up again
+CLAIM_TIMEOUT = int(os.environ.get("JIRA_SYNC_CLAIM_TIMEOUT", "1800"))  # seconds
 
 # Team Roster Path (for name mapping)
 TEAM_ROSTER_PATH = os.environ.get("TEAM_ROSTER_PATH", "/app/team_roster.txt")
@@ -54,6 +58,12 @@ JIRA_RETRY_BACKOFF_BASE = float(os.environ.get("JIRA_RETRY_BACKOFF_BASE", "2.0")
 # OpenAI Configuration for Task Type Classification
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "")
 TASK_CLASSIFICATION_MODEL = os.environ.get("TASK_CLASSIFICATION_MODEL", "gpt-4o-mini")
+# Classify via the OpenAI Batch API (cheaper, up to 24h turnaround) instead of inline calls
+USE_BATCH_API = os.environ.get("TASK_CLASSIFICATION_USE_BATCH_API", "false").lower() == "true"
+# Send the full classification guidelines instead of the compact one-letter prompt (debugging)
+CLASSIFICATION_PROMPT_VERBOSE = os.environ.get("TASK_CLASSIFICATION_PROMPT_VERBOSE", "false").lower() == "true"
+# Classify with keyword heuristics only, never calling the LLM (unmatched items become Task)
+CLASSIFICATION_HEURISTIC_ONLY = os.environ.get("TASK_CLASSIFICATION_HEURISTIC_ONLY", "false").lower() == "true"
 
 # Initialize OpenAI client if API key is provided
 openai_client: Optional[OpenAI] = None
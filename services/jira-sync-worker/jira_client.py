@@ -1,8 +1,12 @@
 """Jira API Client with rate limiting and error handling"""
 import logging
+import threading
 import time
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple
 from jira import JIRA, JIRAError
+from requests.adapters import HTTPAdapter
 from config import (
     JIRA_BASE_URL,
     JIRA_USER_EMAIL,
@@ -11,10 +15,44 @@ from config import (
     JIRA_RETRY_MAX_ATTEMPTS,
     JIRA_RETRY_BACKOFF_BASE,
     DRY_RUN,
+    JIRA_SYNC_WORKERS,
 )
 
 logger = logging.getLogger(__name__)
 
+# Jira Cloud accepts at most 50 issues per issue/bulk request
+JIRA_BULK_CREATE_LIMIT = 50
+
+# name -> (expires_at, accountId), shared by all JiraClient instances so owners
+# that show up in many meetings are only searched once per process. Only found
+# users are cached; least recently used entries are evicted first. Assignees are
+# prefetched from worker threads, hence the lock.
+USER_CACHE_SIZE = 1024
+USER_CACHE_TTL = 3600  # seconds; picks up renamed or deactivated accounts
+_user_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+_user_cache_lock = threading.Lock()
+
+
+def _cached_account_id(name: str) -> Optional[str]:
+    with _user_cache_lock:
+        entry = _user_cache.get(name)
+        if entry is None:
+            return None
+        expires_at, account_id = entry
+        if expires_at <= time.monotonic():
+            del _user_cache[name]
+            return None
+        _user_cache.move_to_end(name)
+        return account_id
+
+
+def _cache_account_id(name: str, account_id: str) -> None:
+    with _user_cache_lock:
+        _user_cache[name] = (time.monotonic() + USER_CACHE_TTL, account_id)
+        _user_cache.move_to_end(name)
+        if len(_user_cache) > USER_CACHE_SIZE:
+            _user_cache.popitem(last=False)
+
 
 class JiraClient:
     """Wrapper around Jira API client with retry logic and rate limiting"""
@@ -30,7 +68,10 @@ class JiraClient:
                 options={"verify": True, "timeout": 30},
                 max_retries=0,  # We handle retries ourselves
             )
-        self._user_cache: Dict[str, Optional[str]] = {}  # name -> accountId
+            # Keep-alive pool large enough for the parallel bulk-create workers
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=max(20, JIRA_SYNC_WORKERS))
+            self.jira._session.mount("https://", adapter)
+            self.jira._session.mount("http://", adapter)
 
     def _retry_with_backoff(self, func, *args, **kwargs):
         """Execute function with exponential backoff retry"""
@@ -38,47 +79,58 @@ class JiraClient:
             try:
                 return func(*args, **kwargs)
             except JIRAError as e:
-                if e.status_code >= 500 and attempt < JIRA_RETRY_MAX_ATTEMPTS - 1:
-                    wait_time = JIRA_RETRY_BACKOFF_BASE ** attempt
+                status_code = e.status_code or 0
+                retryable = status_code == 429 or status_code >= 500
+                if retryable and attempt < JIRA_RETRY_MAX_ATTEMPTS - 1:
+                    wait_time = self._retry_after(e) or JIRA_RETRY_BACKOFF_BASE ** attempt
                     logger.warning(
-                        f"Jira server error {e.status_code}, retrying in {wait_time}s... (attempt {attempt + 1}/{JIRA_RETRY_MAX_ATTEMPTS})"
+                        f"Jira error {status_code}, retrying in {wait_time}s... (attempt {attempt + 1}/{JIRA_RETRY_MAX_ATTEMPTS})"
                     )
                     time.sleep(wait_time)
                 else:
                     raise
         raise JIRAError("Failed after retries")
 
+    @staticmethod
+    def _retry_after(error: JIRAError) -> Optional[float]:
+        """Seconds to wait from the Retry-After header of a 429 response, if any"""
+        response = getattr(error, "response", None)
+        value = response.headers.get("Retry-After") if response is not None else None
+        try:
+            return float(value) if value else None
+        except ValueError:
+            return None
+
     def find_user_by_name(self, name: str) -> Optional[str]:
         """
         Find Jira user accountId by display name.
-        Uses caching to avoid repeated API calls.
+        Found users are cached process-wide for USER_CACHE_TTL; misses and
+        failed searches are not cached, so they are retried on the next meeting.
         """
-        if name in self._user_cache:
-            return self._user_cache[name]
+        account_id = _cached_account_id(name)
+        if account_id is not None:
+            return account_id
 
         if DRY_RUN:
             logger.info(f"[DRY_RUN] Would search for user: {name}")
-            self._user_cache[name] = None
             return None
 
         try:
-            users = self.jira.search_users(query=name, maxResults=1)
+            users = self._retry_with_backoff(self.jira.search_users, query=name, maxResults=1)
             if users:
                 account_id = users[0].accountId
-                self._user_cache[name] = account_id
+                _cache_account_id(name, account_id)
                 logger.debug(f"Found Jira user '{name}' -> accountId: {account_id}")
                 return account_id
             else:
                 logger.warning(f"User '{name}' not found in Jira")
-                self._user_cache[name] = None
                 return None
         except JIRAError as e:
             logger.error(f"Error searching for user '{name}': {e}")
-            self._user_cache[name] = None
             return None
 
-    def create_issue(
-        self,
+    @staticmethod
+    def build_issue_fields(
         summary: str,
         description: str,
         issue_type: str,
@@ -86,11 +138,8 @@ class JiraClient:
         due_date: Optional[str] = None,
         priority: Optional[str] = None,
         labels: Optional[List[str]] = None,
-    ) -> Optional[Dict[str, Any]]:
-        """
-        Create a Jira issue.
-        Returns dict with 'key' and 'id' on success, None on failure.
-        """
+    ) -> Dict[str, Any]:
+        """Build the Jira 'fields' payload for a new issue"""
         fields = {
             "project": {"key": JIRA_PROJECT_KEY},
             "summary": summary,
@@ -110,6 +159,32 @@ class JiraClient:
         if labels:
             fields["labels"] = labels
 
+        return fields
+
+    def create_issue(
+        self,
+        summary: str,
+        description: str,
+        issue_type: str,
+        assignee_account_id: Optional[str] = None,
+        due_date: Optional[str] = None,
+        priority: Optional[str] = None,
+        labels: Optional[List[str]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Create a Jira issue.
+        Returns dict with 'key' and 'id' on success, None on failure.
+        """
+        fields = self.build_issue_fields(
+            summary=summary,
+            description=description,
+            issue_type=issue_type,
+            assignee_account_id=assignee_account_id,
+            due_date=due_date,
+            priority=priority,
+            labels=labels,
+        )
+
         if DRY_RUN:
             logger.info(f"[DRY_RUN] Would create issue: {fields}")
             return {"key": "DRY-RUN-1", "id": "dry-run-1"}
@@ -124,31 +199,61 @@ class JiraClient:
             logger.error(f"Failed to create Jira issue: {e.status_code} - {e.text}")
             return None
 
-    def create_issues_bulk(self, issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def create_issues_bulk(
+        self, issues: List[Dict[str, Any]]
+    ) -> List[Optional[Dict[str, Any]]]:
         """
-        Bulk create multiple issues.
-        Returns list of results, each with 'issue' (key/id) or 'errors'.
+        Bulk create multiple issues via the issue/bulk endpoint.
+        Takes create_issue keyword arguments per issue and sends them in requests of
+        at most JIRA_BULK_CREATE_LIMIT issues, up to JIRA_SYNC_WORKERS in parallel.
+        Returns one dict with 'key' and 'id' per input issue, or None where it failed;
+        a failing request does not discard the issues other requests created.
         """
         if DRY_RUN:
             logger.info(f"[DRY_RUN] Would bulk create {len(issues)} issues")
             return [
-                {"issue": {"key": f"DRY-RUN-{i+1}", "id": f"dry-run-{i+1}"}}
+                {"key": f"DRY-RUN-{i+1}", "id": f"dry-run-{i+1}"}
                 for i in range(len(issues))
             ]
 
+        starts = range(0, len(issues), JIRA_BULK_CREATE_LIMIT)
+        if not starts:
+            return []
+        with ThreadPoolExecutor(max_workers=min(JIRA_SYNC_WORKERS, len(starts))) as executor:
+            chunks = executor.map(
+                lambda start: self._create_issues_chunk(
+                    issues[start : start + JIRA_BULK_CREATE_LIMIT], start
+                ),
+                starts,
+            )
+            return [issue for chunk in chunks for issue in chunk]
+
+    def _create_issues_chunk(
+        self, issues: List[Dict[str, Any]], start: int
+    ) -> List[Optional[Dict[str, Any]]]:
+        """One issue/bulk request; see create_issues_bulk"""
         try:
+            field_list = [self.build_issue_fields(**issue) for issue in issues]
             results = self._retry_with_backoff(
-                self.jira.create_issues, field_list=issues
+                self.jira.create_issues, field_list=field_list, prefetch=False
             )
-            for i, result in enumerate(results):
-                if "issue" in result:
-                    logger.info(f"Created issue: {result['issue']['key']}")
-                elif "errors" in result:
-                    logger.error(f"Failed to create issue {i+1}: {result['errors']}")
-            return results
         except JIRAError as e:
             logger.error(f"Bulk create failed: {e.status_code} - {e.text}")
-            return [{"errors": str(e)} for _ in issues]
+            return [None] * len(issues)
+        except Exception as e:
+            logger.error(f"Bulk create failed: {e}")
+            return [None] * len(issues)
+
+        created: List[Optional[Dict[str, Any]]] = []
+        for i, result in enumerate(results, start=start + 1):
+            issue = result.get("issue")
+            if issue is not None:
+                logger.info(f"Created Jira issue: {issue.key}")
+                created.append({"key": issue.key, "id": issue.id})
+            else:
+                logger.error(f"Failed to create issue {i}: {result.get('error')}")
+                created.append(None)
+        return created
 
     def add_comment(self, issue_key: str, comment: str) -> bool:
         """Add a comment to a Jira issue"""
@@ -157,8 +262,8 @@ class JiraClient:
             return True
 
         try:
-            issue = self.jira.issue(issue_key)
-            self.jira.add_comment(issue, comment)
+            # add_comment accepts the key directly, no need to fetch the issue first
+            self._retry_with_backoff(self.jira.add_comment, issue_key, comment)
             logger.debug(f"Added comment to {issue_key}")
             return True
         except JIRAError as e:
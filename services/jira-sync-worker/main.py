@@ -1,20 +1,29 @@
 """Jira Sync Worker - Syncs meeting insights to Jira issues"""
+import asyncio
+import functools
 import json
 import logging
 import os
+import re
+import select as select_module
 import time
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import and_, func, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Session, selectinload, sessionmaker
 
 from shared_models.database import sync_engine
-from shared_models.models import ActionItem, Meeting, MeetingMetadata
+from shared_models.models import ActionItem, Meeting
 
 from config import (
     BATCH_SIZE,
+    BATCH_CONCURRENCY,
+    CLAIM_TIMEOUT,
     POLL_INTERVAL,
+    JIRA_SYNC_WORKERS,
     PRIORITY_MAPPING,
     JIRA_PROJECT_KEY,
     JIRA_ISSUE_TYPE_TASK,
@@ -30,6 +39,9 @@ from config import (
     validate_config,
     openai_client,
     TASK_CLASSIFICATION_MODEL,
+    USE_BATCH_API,
+    CLASSIFICATION_PROMPT_VERBOSE,
+    CLASSIFICATION_HEURISTIC_ONLY,
 )
 from jira_client import JiraClient
 from team_mapper import get_jira_account_id
@@ -40,21 +52,66 @@ logging.basicConfig(
 )
 logger = logging.getLogger("jira_sync_worker")
 
-SessionLocal = sessionmaker(bind=sync_engine)
+# Keep loaded meetings/action items usable after the claim commit
+SessionLocal = sessionmaker(bind=sync_engine, expire_on_commit=False)
+
+# OpenAI batch statuses that mean the batch has not finished yet
+BATCH_PENDING_STATUSES = {"validating", "in_progress", "finalizing"}
+
+# Channel notified by the meetings_notify_jira_sync trigger when insights complete
+NOTIFY_CHANNEL = "jira_sync"
+
+# (JiraClient.create_issue kwargs, record stored in meeting.data on success)
+IssueRequest = Tuple[Dict[str, Any], Dict[str, Any]]
+
+# Casefolded once at import so map_priority is a single dict lookup
+_PRIORITY_TABLE = {key.casefold(): value for key, value in PRIORITY_MAPPING.items()}
+
+# Deadline date formats tried after ISO 8601
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_DATE_FORMATS = ("%Y-%m-%d", "%d.%m.%Y", "%d/%m/%Y")
+
+# One-letter labels returned with the compact classification prompt
+_CLASSIFICATION_LETTERS = {
+    "e": JIRA_ISSUE_TYPE_EPIC,
+    "f": JIRA_ISSUE_TYPE_FEATURE,
+    "t": JIRA_ISSUE_TYPE_TASK,
+    "b": JIRA_ISSUE_TYPE_BUG,
+}
+
+# Obvious keyword signals (English/Russian) classified without an LLM call; first match wins
+_HEURISTIC_RULES = (
+    (re.compile(r"\bepic\b|\bэпик|большая задача|\broadmap\b", re.IGNORECASE), JIRA_ISSUE_TYPE_EPIC),
+    (re.compile(r"\b(bug|fix(e[sd]|ing)?|hotfix)\b|\b(ошибк|почин|исправ|баг)", re.IGNORECASE), JIRA_ISSUE_TYPE_BUG),
+    (
+        re.compile(r"\b(implement\w*|new (feature|functionality))\b|\b(добав|реализ|внедр)", re.IGNORECASE),
+        JIRA_ISSUE_TYPE_FEATURE,
+    ),
+)
 
+CLASSIFICATION_SYSTEM_PROMPT = (
+    "Classify each task: E(pic), F(eature), T(ask) or B(ug). "
+    'Reply with ONLY a JSON array of letters, one per task in order, e.g. ["T","B"].'
+)
 
-def format_jira_description(
-    text: str, meeting: Meeting, context: Optional[str] = None
-) -> str:
-    """Format text as Jira description with meeting context"""
+
+def build_meeting_header(meeting: Meeting) -> str:
+    """Meeting information block shared by every Jira description of a meeting"""
     meeting_url = meeting.constructed_meeting_url or "N/A"
-    meeting_info = f"""
+    return f"""
 *Meeting Information:*
 * Platform: {meeting.platform}
 * Meeting ID: {meeting.platform_specific_id}
 * Meeting URL: {meeting_url}
 * Date: {meeting.start_time.strftime('%Y-%m-%d %H:%M') if meeting.start_time else 'N/A'}
 """
+
+
+def format_jira_description(
+    text: str, header: str, context: Optional[str] = None
+) -> str:
+    """Format text as Jira description with a precomputed meeting header"""
+    meeting_info = header
     if context:
         meeting_info += f"\n*Context:*\n{context}\n"
 
@@ -65,55 +122,95 @@ def map_priority(priority: Optional[str]) -> Optional[str]:
     """Map Russian priority to Jira priority name"""
     if not priority:
         return None
-    priority_lower = priority.lower()
-    return PRIORITY_MAPPING.get(priority_lower)
+    return _PRIORITY_TABLE.get(priority.strip().casefold())
+
+
+def parse_date(value: Optional[str]) -> Optional[datetime]:
+    """Parse an LLM-provided date string; returns None if no known format matches"""
+    if not value:
+        return None
+    value = value.strip()
+    # Common path: ISO dates/datetimes, parsed without exception round-trips
+    if _ISO_DATE_RE.match(value):
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            pass
+    for date_format in _DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format)
+        except ValueError:
+            continue
+    return None
 
 
 def format_due_date(due_date: Optional[datetime]) -> Optional[str]:
     """Format datetime to Jira date string (YYYY-MM-DD)"""
-    if not due_date:
-        return None
     if isinstance(due_date, str):
         # Try to parse if it's a string
-        try:
-            due_date = datetime.fromisoformat(due_date.replace("Z", "+00:00"))
-        except:
-            return None
+        due_date = parse_date(due_date)
+    if not due_date:
+        return None
     return due_date.strftime("%Y-%m-%d")
 
 
-def classify_task_type(
-    description: str,
+def _map_task_classification(label: str) -> str:
+    """Map a single LLM label (a letter or a full type name) to a configured Jira issue type"""
+    classification = label.strip().lower()
+    if classification in _CLASSIFICATION_LETTERS:
+        return _CLASSIFICATION_LETTERS[classification]
+    if "epic" in classification:
+        return JIRA_ISSUE_TYPE_EPIC
+    elif "feature" in classification or "story" in classification:
+        return JIRA_ISSUE_TYPE_FEATURE
+    elif "bug" in classification:
+        return JIRA_ISSUE_TYPE_BUG
+    # Default to Task for any other response
+    return JIRA_ISSUE_TYPE_TASK
+
+
+def _parse_classification_labels(content: str) -> List[str]:
+    """Parse the JSON array of labels, tolerating markdown code fences"""
+    text = content.strip()
+    if text.startswith("```"):
+        text = text.strip("`")
+        if text.lower().startswith("json"):
+            text = text[4:]
+    labels = json.loads(text)
+    if not isinstance(labels, list):
+        raise ValueError(f"Expected a JSON array, got: {content!r}")
+    return [str(label) for label in labels]
+
+
+def build_classification_request(
+    descriptions: List[str],
     context: Optional[str] = None,
     insights: Optional[Dict[str, Any]] = None,
-) -> str:
-    """
-    Classify task type using LLM based on description and context.
-    Returns: 'epic', 'feature', 'task', or 'bug'
-    
-    Falls back to 'task' if LLM is unavailable or classification fails.
-    """
-    # Fallback to Task if OpenAI client is not available
-    if not openai_client:
-        logger.warning("OpenAI client not available, defaulting to Task type")
-        return JIRA_ISSUE_TYPE_TASK
-    
-    try:
-        # Build context for classification
-        context_parts = []
-        if context:
-            context_parts.append(f"Meeting context: {context}")
-        if insights:
-            summary = insights.get("summary", "")
-            if summary:
-                context_parts.append(f"Meeting summary: {summary}")
-        
+) -> Dict[str, Any]:
+    """Build the chat completion request classifying all descriptions at once"""
+    # Build context for classification
+    context_parts = []
+    if context:
+        context_parts.append(f"Meeting context: {context}")
+    if insights:
+        summary = insights.get("summary", "")
+        if summary and summary != context:
+            context_parts.append(f"Meeting summary: {summary}")
+
+    numbered_tasks = "\n".join(
+        f"{index}. {description}" for index, description in enumerate(descriptions, start=1)
+    )
+
+    # Check if this is a newer model that requires max_completion_tokens
+    is_new_model = "gpt-5" in TASK_CLASSIFICATION_MODEL.lower() or "o1" in TASK_CLASSIFICATION_MODEL.lower()
+
+    if CLASSIFICATION_PROMPT_VERBOSE:
         full_context = "\n".join(context_parts) if context_parts else "No additional context available."
-        
-        # Build prompt for LLM
-        prompt = f"""You are a task classification assistant. Classify the following task into one of these types: Epic, Feature, Task, or Bug.
+        system_prompt = "You are a task classification assistant. Respond with only a JSON array of labels: Epic, Feature, Task, or Bug."
+        prompt = f"""You are a task classification assistant. Classify each of the following tasks into one of these types: Epic, Feature, Task, or Bug.
 
-Task Description: {description}
+Tasks:
+{numbered_tasks}
 
 Additional Context:
 {full_context}
@@ -124,117 +221,396 @@ Classification Guidelines:
 - **Bug**: Fixing defects, errors, problems, or issues with existing functionality
 - **Task**: General work items like documentation, testing, optimization, setup, configuration, decision-making, or selection work
 
-Respond with ONLY one word: Epic, Feature, Task, or Bug. Do not include any explanation or additional text."""
-
-        # Check if this is a newer model that requires max_completion_tokens
-        is_new_model = "gpt-5" in TASK_CLASSIFICATION_MODEL.lower() or "o1" in TASK_CLASSIFICATION_MODEL.lower()
-        
-        # Build request parameters
-        request_params = {
-            "model": TASK_CLASSIFICATION_MODEL,
-            "messages": [
-                {
-                    "role": "system",
-                    "content": "You are a task classification assistant. Respond with only one word: Epic, Feature, Task, or Bug."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-        }
-        
-        # Newer models (gpt-5-nano, o1) don't support custom temperature and use max_completion_tokens
-        if is_new_model:
-            request_params["max_completion_tokens"] = 10  # Only need one word
-        else:
-            request_params["temperature"] = 0.3  # Lower temperature for more consistent classification
-            request_params["max_tokens"] = 10  # Only need one word
-        
-        # Call OpenAI API
-        response = openai_client.chat.completions.create(**request_params)
-        
-        # Extract classification from response
-        classification = response.choices[0].message.content.strip().lower()
-        
-        # Map LLM response to Jira issue types
-        if "epic" in classification:
-            return JIRA_ISSUE_TYPE_EPIC
-        elif "feature" in classification or "story" in classification:
-            return JIRA_ISSUE_TYPE_FEATURE
-        elif "bug" in classification:
-            return JIRA_ISSUE_TYPE_BUG
+Respond with ONLY a JSON array of {len(descriptions)} strings, one per task in the same order, e.g. ["Task", "Bug"]. Do not include any explanation or additional text."""
+        # A few tokens per label plus the array brackets
+        max_tokens = 8 * len(descriptions) + 10
+    else:
+        system_prompt = CLASSIFICATION_SYSTEM_PROMPT
+        prompt = numbered_tasks
+        if context_parts:
+            prompt += "\n\n(" + "\n".join(context_parts) + ")"
+        # One letter plus separator per label, plus the array brackets
+        max_tokens = 4 * len(descriptions) + 10
+
+    # Build request parameters
+    request_params = {
+        "model": TASK_CLASSIFICATION_MODEL,
+        "messages": [
+            {
+                "role": "system",
+                "content": system_prompt
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ],
+    }
+
+    # Newer models (gpt-5-nano, o1) don't support custom temperature and use max_completion_tokens
+    if is_new_model:
+        request_params["max_completion_tokens"] = max_tokens
+    else:
+        request_params["temperature"] = 0.3  # Lower temperature for more consistent classification
+        request_params["max_tokens"] = max_tokens
+
+    return request_params
+
+
+def map_classification_response(content: str, expected_count: int) -> List[str]:
+    """Map the LLM's JSON array of labels to Jira issue types"""
+    labels = _parse_classification_labels(content)
+    if len(labels) != expected_count:
+        raise ValueError(f"LLM returned {len(labels)} labels for {expected_count} tasks")
+    return [_map_task_classification(label) for label in labels]
+
+
+def heuristic_task_type(description: str) -> Optional[str]:
+    """Issue type from obvious keywords in the description, or None if undecided"""
+    for pattern, task_type in _HEURISTIC_RULES:
+        if pattern.search(description):
+            return task_type
+    return None
+
+
+def classify_task_types_batch(
+    descriptions: List[str],
+    context: Optional[str] = None,
+    insights: Optional[Dict[str, Any]] = None,
+) -> List[str]:
+    """
+    Classify several tasks of one meeting with a single LLM request.
+    Returns one of 'epic', 'feature', 'task' or 'bug' issue types per description,
+    in the same order. Descriptions matching a keyword heuristic skip the LLM.
+
+    Falls back to 'task' for every remaining item if LLM is unavailable or
+    classification fails.
+    """
+    if not descriptions:
+        return []
+
+    # Keyword heuristics first; only the remaining descriptions go to the LLM
+    task_types = [heuristic_task_type(description) for description in descriptions]
+    unmatched = [index for index, task_type in enumerate(task_types) if task_type is None]
+    if not unmatched:
+        return task_types
+    if CLASSIFICATION_HEURISTIC_ONLY:
+        # Unmatched items default to Task without an LLM call
+        return [task_type or JIRA_ISSUE_TYPE_TASK for task_type in task_types]
+
+    llm_types = [JIRA_ISSUE_TYPE_TASK] * len(unmatched)
+    if not openai_client:
+        # Fallback to Task if OpenAI client is not available
+        logger.warning("OpenAI client not available, defaulting to Task type")
+    else:
+        try:
+            request_params = build_classification_request(
+                [descriptions[index] for index in unmatched], context, insights
+            )
+            response = openai_client.chat.completions.create(**request_params)
+            llm_types = map_classification_response(
+                response.choices[0].message.content, len(unmatched)
+            )
+        except Exception as e:
+            logger.error(f"Failed to classify task types using LLM: {e}", exc_info=True)
+            # Fallback to Task on error
+
+    for index, task_type in zip(unmatched, llm_types):
+        task_types[index] = task_type
+    return task_types
+
+
+def classify_task_type(
+    description: str,
+    context: Optional[str] = None,
+    insights: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Classify task type using LLM based on description and context.
+    Returns: 'epic', 'feature', 'task', or 'bug'
+    """
+    return classify_task_types_batch([description], context=context, insights=insights)[0]
+
+
+def _classification_custom_id(meeting: Meeting) -> str:
+    return f"meeting-{meeting.id}"
+
+
+def submit_classification_batch(
+    meeting: Meeting,
+    action_items: List[ActionItem],
+    insights: Dict[str, Any],
+) -> str:
+    """
+    Submit the meeting's task classification to the OpenAI Batch API.
+    Returns the batch id; results are picked up by process_classification_batches.
+    """
+    request_params = build_classification_request(
+        [action_item.description for action_item in action_items],
+        context=insights.get("summary", "") if insights else "",
+        insights=insights,
+    )
+    line = {
+        "custom_id": _classification_custom_id(meeting),
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": request_params,
+    }
+    input_file = openai_client.files.create(
+        file=(f"jira-classify-{meeting.id}.jsonl", json.dumps(line, ensure_ascii=False).encode("utf-8")),
+        purpose="batch",
+    )
+    batch = openai_client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+        metadata={"meeting_id": str(meeting.id)},
+    )
+    return batch.id
+
+
+def read_classification_batch_output(
+    output_file_id: str, meeting: Meeting, expected_count: int
+) -> List[str]:
+    """Download a finished batch output and map the meeting's labels to issue types"""
+    output = openai_client.files.content(output_file_id).text
+    custom_id = _classification_custom_id(meeting)
+    for raw_line in output.splitlines():
+        if not raw_line.strip():
+            continue
+        result = json.loads(raw_line)
+        if result.get("custom_id") != custom_id:
+            continue
+        response = result.get("response") or {}
+        if result.get("error") or response.get("status_code") != 200:
+            raise RuntimeError(f"Batch request failed: {result.get('error') or response}")
+        content = response["body"]["choices"][0]["message"]["content"]
+        return map_classification_response(content, expected_count)
+    raise RuntimeError(f"No result for {custom_id} in batch output {output_file_id}")
+
+
+def update_meeting_data(
+    session: Session,
+    meeting: Meeting,
+    patch: Dict[str, Any],
+    remove: Tuple[str, ...] = (),
+) -> None:
+    """
+    Merge keys into meeting.data server-side (coalesce(data, '{}') || patch - remove),
+    so only the patch is sent instead of the whole JSONB document with insights.
+    A NULL data column is treated as empty (NULL || patch would stay NULL).
+    meeting.data is expired rather than patched in memory: it is re-read on next
+    access through the normal load path, so it comes back as a change-tracked
+    MutableDict (a value set with set_committed_value would not be).
+    """
+    data = _meeting_data_or_empty().op("||")(literal(patch, JSONB))
+    for key in remove:
+        data = data.op("-")(key)
+    session.execute(
+        update(Meeting).where(Meeting.id == meeting.id).values(data=data),
+        execution_options={"synchronize_session": False},
+    )
+    session.expire(meeting, ["data"])
+
+
+def _meeting_data_or_empty():
+    return func.coalesce(Meeting.data, literal({}, JSONB))
+
+
+def process_classification_batches(session: Session) -> bool:
+    """
+    Finish syncing meetings whose classification batch is done.
+    Failed or expired batches fall back to synchronous classification.
+    Returns True if any meeting was synced.
+    """
+    if not USE_BATCH_API or not openai_client:
+        return False
+
+    meetings = (
+        session.execute(
+            select(Meeting)
+            .where(Meeting.data["jira_sync_state"].astext == "classifying")
+            .options(selectinload(Meeting.action_items))
+        )
+        .scalars()
+        .all()
+    )
+
+    processed_any = False
+    for meeting in meetings:
+        batch_id = meeting.data.get("jira_classify_batch_id")
+        try:
+            batch = openai_client.batches.retrieve(batch_id)
+        except Exception as e:
+            logger.warning(f"Could not check classification batch {batch_id} for meeting {meeting.id}: {e}")
+            continue
+
+        if batch.status in BATCH_PENDING_STATUSES:
+            continue
+
+        action_items = meeting_action_items(meeting)
+        task_types = None
+        if batch.status == "completed" and batch.output_file_id:
+            try:
+                task_types = read_classification_batch_output(
+                    batch.output_file_id, meeting, len(action_items)
+                )
+                # Keyword heuristics take precedence, as in synchronous classification
+                task_types = [
+                    heuristic_task_type(action_item.description) or task_type
+                    for action_item, task_type in zip(action_items, task_types)
+                ]
+            except Exception as e:
+                logger.error(f"Failed to read classification batch {batch_id} for meeting {meeting.id}: {e}")
         else:
-            # Default to Task for any other response
-            return JIRA_ISSUE_TYPE_TASK
-            
-    except Exception as e:
-        logger.error(f"Failed to classify task type using LLM: {e}", exc_info=True)
-        # Fallback to Task on error
-        return JIRA_ISSUE_TYPE_TASK
+            logger.warning(
+                f"Classification batch {batch_id} for meeting {meeting.id} ended as '{batch.status}', "
+                "classifying synchronously"
+            )
+
+        update_meeting_data(
+            session,
+            meeting,
+            {"jira_sync_state": "processing", "jira_claimed_at": time.time()},
+            remove=("jira_classify_batch_id",),
+        )
+        session.commit()
+        sync_meeting_to_jira(session, meeting, task_types=task_types, defer_classification=False)
+        processed_any = True
+
+    return processed_any
 
 
-def select_next_meeting(session: Session) -> Optional[Meeting]:
+def _claimable():
     """
-    Select next meeting that needs Jira sync.
-    Criteria:
+    jira_sync_state condition for meetings a worker may claim: never synced,
+    failed, or a 'processing' claim older than CLAIM_TIMEOUT whose worker died.
+    """
+    sync_state = Meeting.data["jira_sync_state"].astext
+    claimed_at = Meeting.data["jira_claimed_at"].as_float()
+    stale = or_(
+        claimed_at.is_(None),
+        claimed_at < func.extract("epoch", func.now()) - CLAIM_TIMEOUT,
+    )
+    return or_(
+        sync_state.is_(None),
+        sync_state == "failed",
+        and_(sync_state == "processing", stale),
+    )
+
+
+def _claim_data():
+    """meeting.data with the 'processing' claim and its timestamp merged in"""
+    return _meeting_data_or_empty().op("||")(
+        func.jsonb_build_object(
+            "jira_sync_state", "processing",
+            "jira_claimed_at", func.extract("epoch", func.now()),
+        )
+    )
+
+
+def select_next_meetings(session: Session, limit: int) -> List[Meeting]:
+    """
+    Claim up to `limit` meetings that need Jira sync by marking them as processing.
+    Criteria (evaluated in SQL, backed by ix_meeting_jira_sync_pending):
     - summary_state = 'completed' (insights generated)
     - data->'insights_ru' exists
-    - data->>'jira_sync_state' IS NULL or = 'failed'
+    - data->>'jira_sync_state' IS NULL, 'failed', or a stale 'processing' claim
+    Rows are locked (SKIP LOCKED) and marked in a single UPDATE ... RETURNING,
+    and the claim is committed right away so no row lock is held across the
+    OpenAI and Jira calls. A claim left behind by a dead worker is picked up
+    again once it is older than CLAIM_TIMEOUT.
     """
-    stmt = (
-        select(Meeting)
+    pending = (
+        select(Meeting.id)
         .where(
             Meeting.summary_state == "completed",
-            Meeting.data.isnot(None),
+            Meeting.data.has_key("insights_ru"),
+            _claimable(),
         )
         .order_by(Meeting.processed_at.desc())  # Process newest meetings first
         .with_for_update(skip_locked=True)
-        .limit(1)
+        .limit(limit)
     )
+    claim = (
+        update(Meeting)
+        .where(Meeting.id.in_(pending))
+        .values(data=_claim_data())
+        .returning(Meeting.id)
+    )
+    meeting_ids = session.execute(
+        claim, execution_options={"synchronize_session": False}
+    ).scalars().all()
+    session.commit()
 
-    meeting = session.execute(stmt).scalars().first()
-    if not meeting:
-        return None
+    if not meeting_ids:
+        return []
 
-    # Check if insights exist and sync hasn't been completed
-    insights = meeting.data.get("insights_ru") if meeting.data else None
-    sync_state = meeting.data.get("jira_sync_state") if meeting.data else None
+    # Load the claimed meetings with their action items in one extra query
+    stmt = (
+        select(Meeting)
+        .where(Meeting.id.in_(meeting_ids))
+        .options(selectinload(Meeting.action_items))
+        .order_by(Meeting.processed_at.desc())
+        .execution_options(populate_existing=True)  # pick up the claimed state
+    )
+    return list(session.execute(stmt).scalars().all())
 
-    if not insights:
-        logger.debug(f"Meeting {meeting.id} has no insights_ru")
-        return None
 
-    if sync_state == "success":
-        logger.debug(f"Meeting {meeting.id} already synced to Jira")
-        return None
+def meeting_action_items(meeting: Meeting) -> List[ActionItem]:
+    """Meeting action items in a stable (id) order"""
+    return sorted(meeting.action_items, key=lambda action_item: action_item.id)
 
-    # Mark as processing
-    meeting.data = meeting.data or {}
-    meeting.data["jira_sync_state"] = "processing"
-    session.commit()
-    session.refresh(meeting)
-    return meeting
 
+@functools.lru_cache(maxsize=1)
+def _get_jira_client() -> JiraClient:
+    """Process-wide Jira client so its HTTP session and connections are reused across meetings"""
+    return JiraClient()
 
-def sync_action_items(
-    jira_client: JiraClient,
-    meeting: Meeting,
+
+def prefetch_assignees(jira_client: JiraClient, owners: Set[str]) -> Dict[str, Optional[str]]:
+    """
+    Resolve every owner of a meeting up front: team roster first (no I/O), then
+    parallel Jira user searches for the remaining names.
+    """
+    assignees = {owner: get_jira_account_id(owner) for owner in owners}
+    misses = [owner for owner, account_id in assignees.items() if not account_id]
+    if misses:
+        with ThreadPoolExecutor(max_workers=min(JIRA_SYNC_WORKERS, len(misses))) as executor:
+            assignees.update(zip(misses, executor.map(jira_client.find_user_by_name, misses)))
+    return assignees
+
+
+def classify_action_items(
     action_items: List[ActionItem],
     insights: Dict[str, Any],
-) -> List[Dict[str, Any]]:
-    """Create Jira issues for action items"""
-    created_issues = []
+    task_types: Optional[List[str]] = None,
+) -> List[str]:
+    """
+    Issue types for the action items, classified in one LLM request.
+    task_types, if given, are precomputed issue types (e.g. from the Batch API).
+    """
+    if task_types is not None and len(task_types) == len(action_items):
+        return task_types
+    meeting_summary = insights.get("summary", "") if insights else ""
+    return classify_task_types_batch(
+        [action_item.description for action_item in action_items],
+        context=meeting_summary,
+        insights=insights,
+    )
+
 
-    for action_item in action_items:
-        # Resolve assignee
-        assignee_account_id = None
-        if action_item.owner:
-            # First try team roster mapping
-            assignee_account_id = get_jira_account_id(action_item.owner)
-            # If not found, try Jira user search
-            if not assignee_account_id:
-                assignee_account_id = jira_client.find_user_by_name(action_item.owner)
+def build_action_item_issues(
+    header: str,
+    action_items: List[ActionItem],
+    task_types: List[str],
+    assignees: Dict[str, Optional[str]],
+) -> List[IssueRequest]:
+    """Build Jira issue requests for action items"""
+    issue_requests = []
+
+    for action_item, task_type in zip(action_items, task_types):
+        assignee_account_id = assignees.get(action_item.owner)
 
         # Build description
         description_parts = [action_item.description]
@@ -242,52 +618,34 @@ def sync_action_items(
             description_parts.append(f"\n*Reference:* {action_item.reference_url}")
 
         description = format_jira_description(
-            "\n".join(description_parts), meeting
-        )
-
-        # Classify task type based on description and context
-        # Get meeting summary/context from insights for better classification
-        meeting_summary = insights.get("summary", "") if insights else ""
-        task_type = classify_task_type(
-            description=action_item.description,
-            context=meeting_summary,
-            insights=insights,
+            "\n".join(description_parts), header
         )
 
-        # Create issue
-        issue = jira_client.create_issue(
-            summary=f"{action_item.owner or 'Unassigned'}: {action_item.description[:100]}",
-            description=description,
-            issue_type=task_type,
-            assignee_account_id=assignee_account_id,
-            due_date=format_due_date(action_item.due_date),
-            priority=map_priority(action_item.priority),
-            labels=[JIRA_LABEL_ACTION_ITEM, JIRA_LABEL_MEETING],
-        )
-
-        if issue:
-            created_issues.append(
-                {
-                    "local_id": action_item.id,
-                    "jira_key": issue["key"],
-                    "jira_id": issue["id"],
-                    "type": "action_item",
-                }
-            )
-            logger.info(
-                f"Created Jira issue {issue['key']} for action item {action_item.id}"
+        issue_requests.append(
+            (
+                dict(
+                    summary=f"{action_item.owner or 'Unassigned'}: {action_item.description[:100]}",
+                    description=description,
+                    issue_type=task_type,
+                    assignee_account_id=assignee_account_id,
+                    due_date=format_due_date(action_item.due_date),
+                    priority=map_priority(action_item.priority),
+                    labels=[JIRA_LABEL_ACTION_ITEM, JIRA_LABEL_MEETING],
+                ),
+                {"local_id": action_item.id, "type": "action_item"},
             )
+        )
 
-    return created_issues
+    return issue_requests
 
 
-def sync_blockers(
-    jira_client: JiraClient,
-    meeting: Meeting,
+def build_blocker_issues(
+    header: str,
     blockers: List[Dict[str, Any]],
-) -> List[Dict[str, Any]]:
-    """Create Jira issues for blockers"""
-    created_issues = []
+    assignees: Dict[str, Optional[str]],
+) -> List[IssueRequest]:
+    """Build Jira issue requests for blockers"""
+    issue_requests = []
 
     for blocker in blockers:
         description = blocker.get("description", "")
@@ -303,47 +661,35 @@ def sync_blockers(
             description_parts.append(f"\n*Proposed Action:* {proposed_action}")
 
         full_description = format_jira_description(
-            "\n".join(description_parts), meeting
+            "\n".join(description_parts), header
         )
 
-        # Resolve assignee
-        assignee_account_id = None
-        if owner:
-            assignee_account_id = get_jira_account_id(owner)
-            if not assignee_account_id:
-                assignee_account_id = jira_client.find_user_by_name(owner)
-
-        # Create issue
-        issue = jira_client.create_issue(
-            summary=f"Blocker: {description[:100]}",
-            description=full_description,
-            issue_type=JIRA_ISSUE_TYPE_BLOCKER,
-            assignee_account_id=assignee_account_id,
-            priority="High",  # Blockers are always high priority
-            labels=[JIRA_LABEL_BLOCKER, JIRA_LABEL_MEETING],
-        )
-
-        if issue:
-            created_issues.append(
-                {
-                    "jira_key": issue["key"],
-                    "jira_id": issue["id"],
-                    "type": "blocker",
-                    "description": description,
-                }
+        assignee_account_id = assignees.get(owner) if owner else None
+
+        issue_requests.append(
+            (
+                dict(
+                    summary=f"Blocker: {description[:100]}",
+                    description=full_description,
+                    issue_type=JIRA_ISSUE_TYPE_BLOCKER,
+                    assignee_account_id=assignee_account_id,
+                    priority="High",  # Blockers are always high priority
+                    labels=[JIRA_LABEL_BLOCKER, JIRA_LABEL_MEETING],
+                ),
+                {"type": "blocker", "description": description},
             )
-            logger.info(f"Created Jira issue {issue['key']} for blocker")
+        )
 
-    return created_issues
+    return issue_requests
 
 
-def sync_deadlines(
-    jira_client: JiraClient,
-    meeting: Meeting,
+def build_deadline_issues(
+    header: str,
     deadlines: List[Dict[str, Any]],
-) -> List[Dict[str, Any]]:
-    """Create Jira issues for critical deadlines"""
-    created_issues = []
+    assignees: Dict[str, Optional[str]],
+) -> List[IssueRequest]:
+    """Build Jira issue requests for critical deadlines"""
+    issue_requests = []
 
     for deadline in deadlines:
         name = deadline.get("name", "")
@@ -353,17 +699,9 @@ def sync_deadlines(
         dependencies = deadline.get("dependencies", "")
 
         # Parse date
-        due_date = None
-        if date_str:
-            try:
-                # Try ISO format
-                due_date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-            except:
-                try:
-                    # Try other common formats
-                    due_date = datetime.strptime(date_str, "%Y-%m-%d")
-                except:
-                    logger.warning(f"Could not parse deadline date: {date_str}")
+        due_date = parse_date(date_str)
+        if date_str and not due_date:
+            logger.warning(f"Could not parse deadline date: {date_str}")
 
         # Build description
         description_parts = [f"*Deadline:* {name}"]
@@ -373,154 +711,410 @@ def sync_deadlines(
             description_parts.append(f"\n*Dependencies:* {dependencies}")
 
         full_description = format_jira_description(
-            "\n".join(description_parts), meeting
+            "\n".join(description_parts), header
         )
 
-        # Resolve assignee
-        assignee_account_id = None
-        if owner:
-            assignee_account_id = get_jira_account_id(owner)
-            if not assignee_account_id:
-                assignee_account_id = jira_client.find_user_by_name(owner)
-
-        # Create issue
-        issue = jira_client.create_issue(
-            summary=f"Deadline: {name}",
-            description=full_description,
-            issue_type=JIRA_ISSUE_TYPE_DEADLINE,
-            assignee_account_id=assignee_account_id,
-            due_date=format_due_date(due_date),
-            priority="High",  # Deadlines are high priority
-            labels=[JIRA_LABEL_DEADLINE, JIRA_LABEL_MEETING],
+        assignee_account_id = assignees.get(owner) if owner else None
+
+        issue_requests.append(
+            (
+                dict(
+                    summary=f"Deadline: {name}",
+                    description=full_description,
+                    issue_type=JIRA_ISSUE_TYPE_DEADLINE,
+                    assignee_account_id=assignee_account_id,
+                    due_date=format_due_date(due_date),
+                    priority="High",  # Deadlines are high priority
+                    labels=[JIRA_LABEL_DEADLINE, JIRA_LABEL_MEETING],
+                ),
+                {"type": "deadline", "name": name},
+            )
         )
 
+    return issue_requests
+
+
+def create_issues(
+    jira_client: JiraClient,
+    issue_requests: List[IssueRequest],
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Create Jira issues through the bulk endpoint (create_issues_bulk splits them
+    into parallel requests of at most JIRA_BULK_CREATE_LIMIT issues).
+    Returns the records of successfully created issues (with jira_key/jira_id)
+    in request order, and the number of issues that could not be created.
+    """
+    if not issue_requests:
+        return [], 0
+
+    issues = jira_client.create_issues_bulk([fields for fields, _ in issue_requests])
+    created_issues = []
+    failed = 0
+    for issue, (_, record) in zip(issues, issue_requests):
         if issue:
-            created_issues.append(
-                {
-                    "jira_key": issue["key"],
-                    "jira_id": issue["id"],
-                    "type": "deadline",
-                    "name": name,
-                }
-            )
-            logger.info(f"Created Jira issue {issue['key']} for deadline: {name}")
+            created_issues.append({**record, "jira_key": issue["key"], "jira_id": issue["id"]})
+            logger.info(f"Created Jira issue {issue['key']} for {record['type']}")
+        else:
+            failed += 1
+
+    return created_issues, failed
+
+
+def _issue_record_key(record: Dict[str, Any]) -> Tuple[Any, Any]:
+    """Identity of an issue record, used to skip issues a previous attempt already created"""
+    return (
+        record.get("type"),
+        record.get("local_id") or record.get("description") or record.get("name"),
+    )
 
-    return created_issues
 
+def missing_issue_requests(
+    issue_requests: List[IssueRequest], previous_issues: List[Dict[str, Any]]
+) -> List[IssueRequest]:
+    """Issue requests whose record is not among the issues already created for the meeting"""
+    existing = {_issue_record_key(record) for record in previous_issues}
+    return [
+        (fields, record) for fields, record in issue_requests
+        if _issue_record_key(record) not in existing
+    ]
 
-def sync_meeting_to_jira(session: Session, meeting: Meeting) -> bool:
-    """Sync a single meeting's insights to Jira"""
+
+def sync_meeting_to_jira(
+    session: Session,
+    meeting: Meeting,
+    task_types: Optional[List[str]] = None,
+    defer_classification: bool = USE_BATCH_API,
+) -> bool:
+    """
+    Sync a single meeting's insights to Jira.
+    With defer_classification, action items are first classified through the
+    OpenAI Batch API and the meeting is parked in the 'classifying' state.
+    """
     insights = meeting.data.get("insights_ru") if meeting.data else None
     if not insights:
         logger.warning(f"Meeting {meeting.id} has no insights_ru")
         return False
 
-    jira_client = JiraClient()
-    all_created_issues = []
+    jira_client = _get_jira_client()
 
     try:
-        # Sync action items
-        action_items = (
-            session.query(ActionItem)
-            .filter(ActionItem.meeting_id == meeting.id)
-            .all()
+        action_items = meeting_action_items(meeting)
+
+        needs_llm = not CLASSIFICATION_HEURISTIC_ONLY and any(
+            heuristic_task_type(action_item.description) is None for action_item in action_items
         )
-        if action_items:
-            created = sync_action_items(jira_client, meeting, action_items, insights)
-            all_created_issues.extend(created)
+        if defer_classification and openai_client and needs_llm and task_types is None:
+            try:
+                batch_id = submit_classification_batch(meeting, action_items, insights)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to submit classification batch for meeting {meeting.id}, "
+                    f"classifying synchronously: {e}"
+                )
+            else:
+                update_meeting_data(
+                    session,
+                    meeting,
+                    {"jira_sync_state": "classifying", "jira_classify_batch_id": batch_id},
+                )
+                session.commit()
+                logger.info(f"Submitted classification batch {batch_id} for meeting {meeting.id}")
+                return True
 
-        # Sync blockers
         blockers = insights.get("blockers", [])
-        if blockers:
-            created = sync_blockers(jira_client, meeting, blockers)
-            all_created_issues.extend(created)
-
-        # Sync deadlines
         deadlines = insights.get("critical_deadlines", [])
+
+        # All owners are resolved in one parallel pass while the classification
+        # LLM call runs; the two are independent. Worker threads only get plain
+        # values and the Jira client: the Session and ORM objects stay on this thread.
+        owners = {action_item.owner for action_item in action_items if action_item.owner}
+        owners.update(item["owner"] for item in (blockers or []) + (deadlines or []) if item.get("owner"))
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assignees_future = executor.submit(prefetch_assignees, jira_client, owners)
+            if action_items:
+                task_types = classify_action_items(action_items, insights, task_types)
+            assignees = assignees_future.result()
+
+        # Action items, blockers and deadlines are independent of each other,
+        # so all of the meeting's issues are created together in bulk.
+        header = build_meeting_header(meeting)
+        issue_requests: List[IssueRequest] = []
+        if action_items:
+            issue_requests.extend(
+                build_action_item_issues(header, action_items, task_types, assignees)
+            )
+        if blockers:
+            issue_requests.extend(build_blocker_issues(header, blockers, assignees))
         if deadlines:
-            created = sync_deadlines(jira_client, meeting, deadlines)
-            all_created_issues.extend(created)
+            issue_requests.extend(build_deadline_issues(header, deadlines, assignees))
 
-        # Update meeting data with sync results
-        meeting.data = meeting.data or {}
-        meeting.data["jira_sync_state"] = "success"
-        meeting.data["jira_issues"] = all_created_issues
-        meeting.data["jira_synced_at"] = datetime.utcnow().isoformat()
+        # A retry after a partial failure only creates the issues still missing
+        previous_issues = meeting.data.get("jira_issues") or []
+        issue_requests = missing_issue_requests(issue_requests, previous_issues)
 
+        created_issues, failed = create_issues(jira_client, issue_requests)
+        all_created_issues = previous_issues + created_issues
+
+        # Record the created issue keys straight away, even if some issues failed
+        patch: Dict[str, Any] = {"jira_issues": all_created_issues}
+        if failed:
+            patch.update(
+                jira_sync_state="failed",
+                jira_error=f"{failed} of {len(issue_requests)} Jira issues could not be created",
+            )
+        else:
+            patch.update(jira_sync_state="success", jira_synced_at=datetime.utcnow().isoformat())
+        update_meeting_data(session, meeting, patch)
         session.commit()
+
+        if failed:
+            logger.warning(
+                f"Partially synced meeting {meeting.id} to Jira: {len(created_issues)} issues created, "
+                f"{failed} failed"
+            )
+            return False
         logger.info(
-            f"Successfully synced meeting {meeting.id} to Jira: {len(all_created_issues)} issues created"
+            f"Successfully synced meeting {meeting.id} to Jira: {len(created_issues)} issues created"
         )
         return True
 
     except Exception as e:
         logger.exception(f"Failed to sync meeting {meeting.id} to Jira: {e}")
-        meeting.data = meeting.data or {}
-        meeting.data["jira_sync_state"] = "failed"
-        meeting.data["jira_error"] = str(e)
+        session.rollback()
+        update_meeting_data(session, meeting, {"jira_sync_state": "failed", "jira_error": str(e)})
         session.commit()
         return False
 
 
+def process_next_meeting() -> bool:
+    """Claim and sync one pending meeting in its own session; False if none is pending"""
+    with SessionLocal() as session:
+        meetings = select_next_meetings(session, 1)
+        if not meetings:
+            return False
+        meeting = meetings[0]
+        try:
+            success = sync_meeting_to_jira(session, meeting)
+            if not success:
+                logger.warning(f"Failed to sync meeting {meeting.id}")
+        except Exception as exc:
+            logger.exception(f"Error processing meeting {meeting.id}: {exc}")
+            # Reset sync state on error
+            update_meeting_data(session, meeting, {"jira_sync_state": None})
+            session.commit()
+        return True
+
+
 def process_batch() -> bool:
-    """Process a batch of meetings"""
-    processed_any = False
+    """
+    Process a batch of up to BATCH_SIZE meetings, BATCH_CONCURRENCY at a time.
+    A Session is never shared between threads: each meeting is claimed and
+    synced in its own session, opened on the thread that syncs it.
+    """
     with SessionLocal() as session:
-        for _ in range(BATCH_SIZE):
-            meeting = select_next_meeting(session)
-            if not meeting:
-                break
-            try:
-                success = sync_meeting_to_jira(session, meeting)
-                processed_any = True
-                if not success:
-                    logger.warning(f"Failed to sync meeting {meeting.id}")
-            except Exception as exc:
-                logger.exception(f"Error processing meeting {meeting.id}: {exc}")
-                # Reset sync state on error
-                meeting.data = meeting.data or {}
-                meeting.data["jira_sync_state"] = None
-                session.commit()
-    return processed_any
+        processed_any = process_classification_batches(session)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(BATCH_CONCURRENCY, BATCH_SIZE))) as executor:
+        results = list(executor.map(lambda _: process_next_meeting(), range(BATCH_SIZE)))
+    return processed_any or any(results)
 
 
 def sync_meeting_by_id(meeting_id: int) -> bool:
     """Sync a specific meeting by ID (for HTTP trigger)"""
     with SessionLocal() as session:
-        meeting = session.query(Meeting).filter(Meeting.id == meeting_id).first()
+        # Claim the meeting the same way the poller does, without waiting on
+        # a worker that is already syncing it
+        claimed_id = session.execute(
+            update(Meeting)
+            .where(
+                Meeting.id == meeting_id,
+                Meeting.data.has_key("insights_ru"),
+                _claimable(),
+            )
+            .values(data=_claim_data())
+            .returning(Meeting.id),
+            execution_options={"synchronize_session": False},
+        ).scalar_one_or_none()
+        session.commit()
+
+        meeting = session.execute(
+            select(Meeting)
+            .where(Meeting.id == meeting_id)
+            .options(selectinload(Meeting.action_items))
+        ).scalar_one_or_none()
         if not meeting:
             logger.error(f"Meeting {meeting_id} not found")
             return False
-        
-        # Check if already synced
-        sync_state = meeting.data.get("jira_sync_state") if meeting.data else None
-        if sync_state == "success":
-            logger.info(f"Meeting {meeting_id} already synced to Jira, skipping")
-            return True
-        
+
+        if claimed_id is None:
+            sync_state = meeting.data.get("jira_sync_state") if meeting.data else None
+            if sync_state == "success":
+                logger.info(f"Meeting {meeting_id} already synced to Jira, skipping")
+                return True
+            if sync_state == "classifying":
+                logger.info(f"Meeting {meeting_id} is waiting for its classification batch, skipping")
+                return True
+            if sync_state == "processing":
+                logger.info(f"Meeting {meeting_id} is being synced by another worker, skipping")
+                return True
+            logger.warning(f"Meeting {meeting_id} has no insights_ru")
+            return False
+
         return sync_meeting_to_jira(session, meeting)
 
 
-def main():
-    """Main worker loop"""
-    # Validate configuration
+def open_notification_listener():
+    """
+    Open a dedicated connection that LISTENs on NOTIFY_CHANNEL.
+    Returns None if it cannot be opened; the worker then falls back to polling.
+    """
+    try:
+        connection = sync_engine.raw_connection()
+        # Held for the worker's lifetime, never handed back to the pool
+        connection.detach()
+        dbapi_connection = connection.driver_connection
+        dbapi_connection.autocommit = True
+        with dbapi_connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {NOTIFY_CHANNEL};")
+        logger.info(f"Listening for notifications on channel '{NOTIFY_CHANNEL}'")
+        return connection
+    except Exception as e:
+        logger.warning(f"Could not LISTEN on '{NOTIFY_CHANNEL}', polling only: {e}")
+        return None
+
+
+def wait_for_notification(listener, timeout: float):
+    """
+    Block until a NOTIFY arrives or timeout elapses, draining pending notifications.
+    Returns the listener to keep using, or None if the connection broke.
+    """
+    if listener is None:
+        time.sleep(timeout)
+        return None
+
+    dbapi_connection = listener.driver_connection
+    try:
+        ready, _, _ = select_module.select([dbapi_connection], [], [], timeout)
+        if ready:
+            _drain_notifications(dbapi_connection)
+        return listener
+    except Exception as e:
+        return _close_listener(listener, e)
+
+
+async def wait_for_notification_async(listener, timeout: float, stop: asyncio.Event):
+    """
+    wait_for_notification for the asyncio loop: the LISTEN socket is watched
+    by the event loop instead of a select() in a worker thread, and the wait
+    also ends as soon as `stop` is set.
+    """
+    if listener is None:
+        await _wait_any([stop], timeout)
+        return None
+
+    loop = asyncio.get_running_loop()
+    dbapi_connection = listener.driver_connection
+    try:
+        readable = asyncio.Event()
+        fd = dbapi_connection.fileno()
+        loop.add_reader(fd, readable.set)
+        try:
+            await _wait_any([readable, stop], timeout)
+        finally:
+            loop.remove_reader(fd)
+        if readable.is_set():
+            _drain_notifications(dbapi_connection)
+        return listener
+    except Exception as e:
+        return _close_listener(listener, e)
+
+
+async def _wait_any(events: List[asyncio.Event], timeout: float) -> None:
+    """Wait until any of `events` is set or timeout elapses"""
+    waiters = [asyncio.ensure_future(event.wait()) for event in events]
+    try:
+        await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for waiter in waiters:
+            waiter.cancel()
+
+
+def _drain_notifications(dbapi_connection) -> None:
+    dbapi_connection.poll()
+    notified = [n.payload for n in dbapi_connection.notifies]
+    dbapi_connection.notifies.clear()
+    logger.debug(f"Woken up by notifications for meetings: {notified}")
+
+
+def _close_listener(listener, error: Exception) -> None:
+    logger.warning(f"Notification listener failed, reconnecting: {error}")
+    try:
+        listener.close()
+    except Exception:
+        pass
+    return None
+
+
+def _log_worker_start() -> bool:
+    """Validate configuration and log worker settings; False if misconfigured"""
     is_valid, error = validate_config()
     if not is_valid:
         logger.error(f"Configuration error: {error}")
         logger.error("Please set JIRA_BASE_URL, JIRA_USER_EMAIL, JIRA_API_TOKEN, JIRA_PROJECT_KEY")
-        return
+        return False
 
     logger.info("Starting Jira sync worker")
     logger.info(f"Jira project: {JIRA_PROJECT_KEY}")
     logger.info(f"Poll interval: {POLL_INTERVAL}s")
     logger.info(f"Batch size: {BATCH_SIZE}")
+    return True
+
+
+def main():
+    """Main worker loop"""
+    if not _log_worker_start():
+        return
 
+    # NOTIFY wakes the loop up early; POLL_INTERVAL stays as the polling floor
+    # in case a notification is missed (e.g. while the listener reconnects).
+    listener = open_notification_listener()
     while True:
         had_work = process_batch()
-        sleep_for = 2 if had_work else POLL_INTERVAL
-        time.sleep(sleep_for)
+        if had_work:
+            time.sleep(2)
+            continue
+        if listener is None:
+            listener = open_notification_listener()
+        listener = wait_for_notification(listener, POLL_INTERVAL)
+
+
+async def main_async(stop: Optional[asyncio.Event] = None):
+    """
+    Worker loop for running inside an asyncio event loop (the single poller
+    process started by run_api; never one per uvicorn worker).
+    Blocking DB/Jira/OpenAI work runs in worker threads so the loop stays free.
+    Setting `stop` ends the loop right away when idle, or after the batch in
+    progress otherwise.
+    """
+    if not _log_worker_start():
+        return
+
+    stop = stop or asyncio.Event()
+    listener = await asyncio.to_thread(open_notification_listener)
+    try:
+        while not stop.is_set():
+            had_work = await asyncio.to_thread(process_batch)
+            if had_work:
+                await _wait_any([stop], 2)
+                continue
+            if listener is None:
+                listener = await asyncio.to_thread(open_notification_listener)
+            listener = await wait_for_notification_async(listener, POLL_INTERVAL, stop)
+    finally:
+        if listener is not None:
+            listener.close()
+    logger.info("Jira sync worker stopped")
 
 
 if __name__ == "__main__":
     main()
-
@@ -1,10 +1,20 @@
-"""Run Jira Sync Worker as FastAPI service with background polling"""
+"""
+Run Jira Sync Worker as FastAPI service with background polling.
+
+The poller and the API server each run in their own child process. If either
+one dies, the other is stopped and this process exits with its code, so the
+container restart policy brings both back instead of leaving the API serving
+while Jira sync has silently stopped.
+"""
+import asyncio
 import logging
+import multiprocessing
 import os
-import threading
+import signal
+import sys
+from multiprocessing.connection import wait
+
 import uvicorn
-from api import app
-from main import main as worker_main
 
 logging.basicConfig(
     level=os.environ.get("LOG_LEVEL", "INFO").upper(),
@@ -12,20 +22,74 @@ logging.basicConfig(
 )
 logger = logging.getLogger("jira_sync_runner")
 
-# Start background worker thread
-def start_worker():
-    """Start the polling worker in a background thread"""
-    logger.info("Starting background polling worker thread")
-    worker_thread = threading.Thread(target=worker_main, daemon=True)
-    worker_thread.start()
-    return worker_thread
 
-if __name__ == "__main__":
-    # Start background worker
-    start_worker()
-    
-    # Run FastAPI server
+def run_poller():
+    """Run the polling worker loop (see main.main_async)"""
+    from main import main_async as worker_main_async
+
+    async def run():
+        # SIGTERM from the supervisor ends the loop cleanly
+        # instead of killing it in the middle of a sync
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(signum, stop.set)
+        await worker_main_async(stop)
+
+    asyncio.run(run())
+
+
+def run_api():
+    """Run the trigger API server"""
     port = int(os.environ.get("JIRA_SYNC_API_PORT", "8004"))
-    logger.info(f"Starting Jira Sync Worker API on port {port}")
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    workers = int(os.environ.get("WEB_CONCURRENCY", "4"))
+    logger.info(f"Starting Jira Sync Worker API on port {port} ({workers} workers)")
+    # Multiple workers need an import string
+    uvicorn.run(
+        "api:app",
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        workers=workers,
+    )
+
+
+def stop(processes):
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+    for process in processes:
+        process.join(timeout=10)
+        if process.is_alive():
+            process.kill()
+
+
+if __name__ == "__main__":
+    # Exactly one polling loop per container, in its own process. The uvicorn
+    # workers only serve /trigger; the poller's classification-batch step picks
+    # up 'classifying' meetings without a row claim, so it must not run in each
+    # of them. Not daemonic: the API process forks its own uvicorn workers.
+    poller = multiprocessing.Process(target=run_poller, name="jira-sync-poller")
+    api = multiprocessing.Process(target=run_api, name="jira-sync-api")
+    processes = [poller, api]
+    for process in processes:
+        process.start()
+
+    def handle_sigterm(signum, frame):
+        stop(processes)
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, handle_sigterm)
 
+    wait([process.sentinel for process in processes])
+    exited = next(process for process in processes if not process.is_alive())
+    if exited is poller and poller.exitcode == 0 and api.is_alive():
+        # The poller returns cleanly on its own only when Jira is not configured;
+        # the API still answers /health, and /trigger reports the sync failure
+        logger.warning("Jira sync poller exited (not configured); serving the API only")
+        api.join()
+        exited = api
+    logger.error(f"{exited.name} exited with code {exited.exitcode}; stopping")
+    stop(processes)
+    sys.exit(exited.exitcode or 1)
@@ -1,7 +1,8 @@
 """Team member name to Jira accountId mapping"""
 import logging
+import os
 import re
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from config import TEAM_ROSTER_PATH
 
 logger = logging.getLogger(__name__)
@@ -9,63 +10,92 @@ logger = logging.getLogger(__name__)
 # Simple in-memory mapping: name -> jira_account_id
 # Format: Name — Role — Responsibilities | jira_account_id:xxxxx
 # Example: Анна Ким — Продакт-оунер — ... | jira_account_id:5d1234567890abcdef123456
+_ACCOUNT_ID_RE = re.compile(r"jira_account_id:(\S+)")
 
-_team_mapping: Dict[str, Optional[str]] = {}
+
+# (roster mtime_ns, name -> accountId, casefolded name -> accountId). The roster is
+# re-read only when its mtime changes, so edits and a roster mounted after startup
+# are picked up without a restart. Replaced as one tuple, so threads resolving
+# assignees never see a half-updated cache.
+_ROSTER_MISSING = -1
+_TEAM_MAPPING_CACHE: Tuple[Optional[int], Dict[str, Optional[str]], Dict[str, Optional[str]]] = (
+    None,
+    {},
+    {},
+)
+
+
+def _read_team_mapping() -> Dict[str, Optional[str]]:
+    """Parse the roster file into name -> accountId (or None if not given)"""
+    team_mapping: Dict[str, Optional[str]] = {}
+    with open(TEAM_ROSTER_PATH, "r", encoding="utf-8") as f:
+        lines = f.readlines()
+
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        # Parse: Name — Role — ... | jira_account_id:xxxxx
+        # Or just: Name — Role — ...
+        parts = line.split("|")
+        name = parts[0].partition("—")[0].strip()
+        if not name:
+            continue
+
+        # Check for jira_account_id in second part
+        jira_account_id = None
+        if len(parts) > 1:
+            account_id_match = _ACCOUNT_ID_RE.search(parts[1])
+            if account_id_match:
+                jira_account_id = account_id_match.group(1)
+
+        team_mapping[name] = jira_account_id
+        if jira_account_id:
+            logger.debug(f"Loaded team member: {name} -> {jira_account_id}")
+        else:
+            logger.debug(f"Loaded team member: {name} -> (no Jira ID)")
+
+    logger.info(f"Loaded {len(team_mapping)} team members from roster")
+    return team_mapping
+
+
+def _team_mapping_cache():
+    global _TEAM_MAPPING_CACHE
+    cached_mtime = _TEAM_MAPPING_CACHE[0]
+    try:
+        mtime = os.stat(TEAM_ROSTER_PATH).st_mtime_ns
+    except FileNotFoundError:
+        if cached_mtime != _ROSTER_MISSING:
+            logger.warning(f"Team roster file not found: {TEAM_ROSTER_PATH}")
+            _TEAM_MAPPING_CACHE = (_ROSTER_MISSING, {}, {})
+        return _TEAM_MAPPING_CACHE
+
+    if mtime != cached_mtime:
+        try:
+            team_mapping = _read_team_mapping()
+        except Exception as e:
+            # Keep the previous mapping; the read is retried on the next lookup
+            logger.error(f"Error loading team roster: {e}")
+            return _TEAM_MAPPING_CACHE
+        _TEAM_MAPPING_CACHE = (
+            mtime,
+            team_mapping,
+            {name.casefold(): account_id for name, account_id in team_mapping.items()},
+        )
+    return _TEAM_MAPPING_CACHE
 
 
 def load_team_mapping() -> Dict[str, Optional[str]]:
     """
     Load team roster and extract Jira account IDs if present.
     Format: Name — Role — ... | jira_account_id:xxxxx
-    Returns dict mapping name -> accountId (or None if not found)
+    Returns dict mapping name -> accountId (or None if not found).
+    Cached until the roster file changes; a missing roster is not cached.
     """
-    global _team_mapping
-    if _team_mapping:
-        return _team_mapping
-
-    try:
-        with open(TEAM_ROSTER_PATH, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-
-            # Parse: Name — Role — ... | jira_account_id:xxxxx
-            # Or just: Name — Role — ...
-            parts = line.split("|")
-            name_part = parts[0].strip()
-            name_match = re.match(r"^([^—]+)", name_part)
-            if name_match:
-                name = name_match.group(1).strip()
-
-                # Check for jira_account_id in second part
-                jira_account_id = None
-                if len(parts) > 1:
-                    jira_part = parts[1].strip()
-                    account_id_match = re.search(r"jira_account_id:(\S+)", jira_part)
-                    if account_id_match:
-                        jira_account_id = account_id_match.group(1)
-
-                _team_mapping[name] = jira_account_id
-                if jira_account_id:
-                    logger.debug(f"Loaded team member: {name} -> {jira_account_id}")
-                else:
-                    logger.debug(f"Loaded team member: {name} -> (no Jira ID)")
-
-        logger.info(f"Loaded {len(_team_mapping)} team members from roster")
-        return _team_mapping
-    except FileNotFoundError:
-        logger.warning(f"Team roster file not found: {TEAM_ROSTER_PATH}")
-        return {}
-    except Exception as e:
-        logger.error(f"Error loading team roster: {e}")
-        return {}
+    return _team_mapping_cache()[1]
 
 
 def get_jira_account_id(name: str) -> Optional[str]:
-    """Get Jira accountId for a team member name"""
-    mapping = load_team_mapping()
-    return mapping.get(name)
-
+    """Get Jira accountId for a team member name (case-insensitive)"""
+    return _team_mapping_cache()[2].get(name.strip().casefold())
@@ -0,0 +1,24 @@
+import unittest
+
+from main import heuristic_task_type
+from config import JIRA_ISSUE_TYPE_BUG, JIRA_ISSUE_TYPE_EPIC, JIRA_ISSUE_TYPE_FEATURE
+
+
+class TestHeuristicTaskType(unittest.TestCase):
+    def test_keywords_pick_issue_type(self):
+        self.assertEqual(heuristic_task_type("Fix the login redirect"), JIRA_ISSUE_TYPE_BUG)
+        self.assertEqual(heuristic_task_type("Draft the Q3 roadmap"), JIRA_ISSUE_TYPE_EPIC)
+        self.assertEqual(heuristic_task_type("Implement CSV export"), JIRA_ISSUE_TYPE_FEATURE)
+        self.assertEqual(heuristic_task_type("Scope the new feature for search"), JIRA_ISSUE_TYPE_FEATURE)
+
+    def test_ordinary_new_is_not_a_feature(self):
+        for description in (
+            "Discuss the new schedule with the team",
+            "Send the new hire their onboarding docs",
+            "Review the new budget numbers",
+        ):
+            self.assertIsNone(heuristic_task_type(description), description)
+
+
+if __name__ == "__main__":
+    unittest.main()
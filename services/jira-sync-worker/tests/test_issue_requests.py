@@ -0,0 +1,40 @@
+import unittest
+
+from main import missing_issue_requests
+
+
+def request(record):
+    return ({"summary": str(record)}, record)
+
+
+class TestMissingIssueRequests(unittest.TestCase):
+    def setUp(self):
+        self.requests = [
+            request({"type": "action_item", "local_id": 1}),
+            request({"type": "action_item", "local_id": 2}),
+            request({"type": "blocker", "description": "БД недоступна"}),
+            request({"type": "deadline", "name": "Релиз"}),
+        ]
+
+    def test_nothing_created_yet(self):
+        self.assertEqual(missing_issue_requests(self.requests, []), self.requests)
+
+    def test_skips_issues_created_by_a_previous_attempt(self):
+        previous_issues = [
+            {"type": "action_item", "local_id": 1, "jira_key": "PRJ-1", "jira_id": "10001"},
+            {"type": "blocker", "description": "БД недоступна", "jira_key": "PRJ-2", "jira_id": "10002"},
+        ]
+        missing = missing_issue_requests(self.requests, previous_issues)
+        self.assertEqual([record for _, record in missing], [
+            {"type": "action_item", "local_id": 2},
+            {"type": "deadline", "name": "Релиз"},
+        ])
+
+    def test_same_identity_of_another_type_is_not_skipped(self):
+        previous_issues = [{"type": "blocker", "name": "Релиз", "jira_key": "PRJ-3", "jira_id": "10003"}]
+        missing = missing_issue_requests(self.requests, previous_issues)
+        self.assertEqual(missing, self.requests)
+
+
+if __name__ == "__main__":
+    unittest.main()
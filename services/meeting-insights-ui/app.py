@@ -1,75 +1,49 @@
-import os
 from datetime import datetime
 from typing import List, Optional
 
+import pandas as pd
 import streamlit as st
-from sqlalchemy import select
-from sqlalchemy.orm import sessionmaker
-
-from shared_models.database import sync_engine
-from shared_models.models import (
-    ActionItem,
-    Meeting,
-    MeetingMetadata,
-    SpeakerHighlight,
-)
 
+from insights_common import MEETINGS_PAGE_SIZE, fetch_meetings, format_datetime, get_meeting_details
 
-SessionLocal = sessionmaker(bind=sync_engine)
+DEADLINE_COLUMNS = ["Этап", "Ответственный", "Дата", "Риск", "Зависимости"]
 
 st.set_page_config(page_title="Инсайты", layout="wide")
 st.title("📊 AI Scrum Master • Инсайты")
 
 
-def fetch_meetings():
-    with SessionLocal() as session:
-        stmt = (
-            select(Meeting, MeetingMetadata)
-            .join(MeetingMetadata, MeetingMetadata.meeting_id == Meeting.id, isouter=True)
-            .where(Meeting.summary_state.in_(["completed", "no_data"]))
-            .order_by(Meeting.start_time.desc().nullslast())
-        )
-        records = session.execute(stmt).all()
-        result = []
-        for meeting, metadata in records:
-            label = meeting.platform_specific_id or f"Meeting #{meeting.id}"
-            if meeting.start_time:
-                label = f"{label} ({meeting.start_time.isoformat()})"
-            result.append(
-                {
-                    "id": meeting.id,
-                    "label": label,
-                    "meeting": meeting,
-                    "metadata": metadata,
-                }
-            )
-        return result
-
-
-def get_meeting_details(meeting_id: int):
-    with SessionLocal() as session:
-        meeting = session.get(Meeting, meeting_id)
-        metadata = meeting.metadata_record if meeting else None
-        action_items = (
-            session.query(ActionItem)
-            .filter(ActionItem.meeting_id == meeting_id)
-            .order_by(ActionItem.due_date.asc().nulls_last())
-            .all()
-        )
-        highlights = (
-            session.query(SpeakerHighlight)
-            .filter(SpeakerHighlight.meeting_id == meeting_id)
-            .order_by(SpeakerHighlight.start_time.asc())
-            .all()
+@st.cache_data(ttl=60, max_entries=64, show_spinner=False)
+def deadlines_frame(meeting_id: int, processed_at: Optional[datetime], _critical_deadlines: List[dict]) -> pd.DataFrame:
+    """
+    Deadline table for a meeting. Keyed like get_meeting_details (id + processed_at);
+    the underscore argument is not hashed, so reruns skip re-hashing the payload.
+    """
+    rows = [
+        (
+            entry.get("name", ""),
+            entry.get("owner", ""),
+            entry.get("date", ""),
+            entry.get("risk", ""),
+            entry.get("dependencies", ""),
         )
-        return meeting, metadata, action_items, highlights
-
-
-def format_datetime(value: Optional[datetime]) -> str:
-    return value.isoformat(sep=" ", timespec="minutes") if value else "—"
-
-
-meetings = fetch_meetings()
+        for entry in _critical_deadlines
+    ]
+    return pd.DataFrame(rows, columns=DEADLINE_COLUMNS)
+
+
+if st.sidebar.button("🔄 Обновить список встреч"):
+    fetch_meetings.clear()
+    get_meeting_details.clear()
+    deadlines_frame.clear()
+
+meetings_page = st.sidebar.number_input(
+    "Страница списка встреч",
+    min_value=1,
+    value=1,
+    step=1,
+    help=f"По {MEETINGS_PAGE_SIZE} встреч на странице, новые первыми",
+)
+meetings = fetch_meetings(int(meetings_page) - 1)
 
 if not meetings:
     st.info("Нет обработанных встреч. Убедитесь, что worker сгенерировал инсайты.")
@@ -81,28 +55,33 @@ selected_label = st.sidebar.selectbox("Выберите встречу", meeting
 selected_entry = next(entry for entry in meetings if entry["label"] == selected_label)
 selected_meeting_id = selected_entry["id"]
 
-meeting, metadata, action_items, highlights = get_meeting_details(selected_meeting_id)
-insights_blob = (meeting.data or {}).get("insights_ru") if meeting else None
-responsible_people = insights_blob.get("responsible_people", []) if isinstance(insights_blob, dict) else []
-critical_deadlines = insights_blob.get("critical_deadlines", []) if isinstance(insights_blob, dict) else []
-blockers = insights_blob.get("blockers", []) if isinstance(insights_blob, dict) else []
-task_breakdown = insights_blob.get("task_breakdown", []) if isinstance(insights_blob, dict) else []
-llm_suggestions = insights_blob.get("llm_suggestions", {}) if isinstance(insights_blob, dict) else {}
-team_snapshot = (meeting.data or {}).get("team_roster_snapshot") if meeting else None
+meeting, metadata, action_items, highlights = get_meeting_details(
+    selected_meeting_id, selected_entry["processed_at"]
+)
+meeting_data = meeting["data"] if meeting else {}
+insights_blob = meeting_data.get("insights_ru")
+# One type check; empty tuples as defaults (no per-rerun list allocation)
+insights = insights_blob if isinstance(insights_blob, dict) else {}
+responsible_people = insights.get("responsible_people", ())
+critical_deadlines = insights.get("critical_deadlines", ())
+blockers = insights.get("blockers", ())
+task_breakdown = insights.get("task_breakdown", ())
+llm_suggestions = insights.get("llm_suggestions", {})
+team_snapshot = meeting_data.get("team_roster_snapshot")
 
 col1, col2, col3 = st.columns(3)
-col1.metric("ID встречи", meeting.platform_specific_id or meeting.id)
-col2.metric("Статус", meeting.status)
+col1.metric("ID встречи", meeting["platform_specific_id"] or meeting["id"])
+col2.metric("Статус", meeting["status"])
 col3.metric(
     "Обработано",
-    format_datetime(meeting.processed_at),
+    format_datetime(meeting["processed_at"]),
 )
 
 st.subheader("Обзор")
 if metadata:
-    st.write(f"**Цель:** {metadata.goal or 'н/д'}")
-    st.write(f"**Резюме:** {metadata.summary or 'н/д'}")
-    st.write(f"**Настроение:** {metadata.sentiment or 'неизвестно'}")
+    st.write(f"**Цель:** {metadata['goal'] or 'н/д'}")
+    st.write(f"**Резюме:** {metadata['summary'] or 'н/д'}")
+    st.write(f"**Настроение:** {metadata['sentiment'] or 'неизвестно'}")
 else:
     st.warning("Инсайты для этой встречи пока недоступны.")
 
@@ -131,18 +110,11 @@ if insights_blob:
 
     st.subheader("Критичные сроки")
     if critical_deadlines:
-        deadline_rows = []
-        for entry in critical_deadlines:
-            deadline_rows.append(
-                {
-                    "Этап": entry.get("name", ""),
-                    "Ответственный": entry.get("owner", ""),
-                    "Дата": entry.get("date", ""),
-                    "Риск": entry.get("risk", ""),
-                    "Зависимости": entry.get("dependencies", ""),
-                }
-            )
-        st.table(deadline_rows)
+        st.dataframe(
+            deadlines_frame(selected_meeting_id, selected_entry["processed_at"], critical_deadlines),
+            use_container_width=True,
+            hide_index=True,
+        )
     else:
         st.info("Нет критичных сроков.")
 
@@ -226,21 +198,17 @@ if team_snapshot:
 
 st.subheader("Задачи")
 if action_items:
-    for item in action_items:
-        cols = st.columns([3, 2, 2, 1])
-        cols[0].write(f"- {item.description}")
-        cols[1].write(f"Ответственный: {item.owner or 'н/д'}")
-        cols[2].write(f"Срок: {format_datetime(item.due_date)}")
-        cols[3].write(item.status or "ожидает")
+    # One grid component instead of four write() widgets per action item
+    st.dataframe(
+        action_items,
+        use_container_width=True,
+        hide_index=True,
+    )
 else:
     st.write("Задачи не обнаружены.")
 
 st.subheader("Ключевые моменты спикеров")
 if highlights:
-    for highlight in highlights:
-        st.write(
-            f"*{highlight.speaker or 'Неизвестно'}* "
-            f"({highlight.start_time:.1f}-{highlight.end_time:.1f}s): {highlight.text}"
-        )
+    st.markdown("\n\n".join(highlights))
 else:
     st.write("Ключевые моменты не извлечены.")
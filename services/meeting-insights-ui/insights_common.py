@@ -0,0 +1,141 @@
+"""
+Data helpers shared by the Streamlit pages (app.py and pages/*).
+
+Cached functions live here once, so every page shares the same session factory
+and st.cache_data entries instead of keeping its own copy.
+Nothing in this module renders, so it is safe to import before set_page_config.
+"""
+import html
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import streamlit as st
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload, selectinload, sessionmaker
+
+from shared_models.database import sync_engine
+from shared_models.models import Meeting
+
+
+@st.cache_resource(show_spinner=False)
+def get_session_factory():
+    """One session factory (and engine pool) shared by all reruns and sessions."""
+    return sessionmaker(bind=sync_engine, expire_on_commit=False)
+
+
+# Upper bound on meetings loaded per selector page
+MEETINGS_PAGE_SIZE = 200
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def fetch_meetings(page: int = 0):
+    """
+    One page (newest first) of processed meetings for the selector;
+    cached for 30 s across reruns.
+    """
+    with get_session_factory()() as session:
+        stmt = (
+            select(
+                Meeting.id,
+                Meeting.platform_specific_id,
+                Meeting.start_time,
+                Meeting.processed_at,
+            )
+            .where(Meeting.summary_state.in_(["completed", "no_data"]))
+            .order_by(Meeting.start_time.desc().nullslast(), Meeting.id.desc())
+            .limit(MEETINGS_PAGE_SIZE)
+            .offset(page * MEETINGS_PAGE_SIZE)
+        )
+        records = session.execute(stmt).all()
+        result = []
+        for meeting_id, platform_specific_id, start_time, processed_at in records:
+            label = platform_specific_id or f"Meeting #{meeting_id}"
+            if start_time:
+                label = f"{label} ({start_time.isoformat()})"
+            # Plain values only: st.cache_data pickles the result
+            result.append({"id": meeting_id, "label": label, "processed_at": processed_at})
+        return result
+
+
+@st.cache_data(ttl=60, max_entries=64, show_spinner=False)
+def get_meeting_details(meeting_id: int, processed_at: Optional[datetime] = None):
+    """
+    Meeting and metadata as plain dicts plus display-ready action item rows
+    and highlight lines (cacheable).
+    processed_at is part of the cache key, so re-processed meetings are reloaded.
+    """
+    with get_session_factory()() as session:
+        meeting = session.execute(
+            select(Meeting)
+            .where(Meeting.id == meeting_id)
+            .options(
+                joinedload(Meeting.metadata_record),
+                selectinload(Meeting.action_items),
+                selectinload(Meeting.speaker_highlights),
+            )
+        ).scalar_one_or_none()
+        if not meeting:
+            return None, None, [], []
+        metadata = meeting.metadata_record
+        # Both collections are ordered by the relationships (due date nulls last, start time)
+        action_items = meeting.action_items
+        highlights = meeting.speaker_highlights
+        meeting_info = {
+            "id": meeting.id,
+            "platform_specific_id": meeting.platform_specific_id,
+            "status": meeting.status,
+            "processed_at": meeting.processed_at,
+            "data": dict(meeting.data or {}),
+        }
+        metadata_info = (
+            {
+                "goal": metadata.goal,
+                "summary": metadata.summary,
+                "sentiment": metadata.sentiment,
+            }
+            if metadata
+            else None
+        )
+        # Rows are formatted once here (cached) so reruns only hand them to the widgets
+        action_item_rows = [
+            {
+                "Задача": item.description,
+                "Ответственный": item.owner or "н/д",
+                "Срок": format_datetime(item.due_date),
+                "Статус": item.status or "ожидает",
+            }
+            for item in action_items
+        ]
+        highlight_rows = [
+            f"*{highlight.speaker or 'Неизвестно'}* "
+            f"({highlight.start_time:.1f}-{highlight.end_time:.1f}s): {highlight.text}"
+            for highlight in highlights
+        ]
+        return meeting_info, metadata_info, action_item_rows, highlight_rows
+
+
+def format_datetime(value: Optional[datetime]) -> str:
+    return value.isoformat(sep=" ", timespec="minutes") if value else "—"
+
+
+def format_citations(chunks: List[Dict[str, Any]]) -> str:
+    """
+    All sources of an answer as one markdown block, built once when the answer
+    arrives: reruns replay a single element per message instead of two per source.
+    The block is rendered with unsafe_allow_html, so every transcript-derived
+    field is HTML-escaped.
+    """
+    blocks = []
+    for i, chunk in enumerate(chunks, 1):
+        meeting_info = html.escape(
+            str(chunk.get("meeting_native_id") or f"Meeting #{chunk.get('meeting_id')}")
+        )
+        speaker = html.escape(str(chunk.get("speaker") or "Неизвестно"))
+        timestamp = html.escape(str(chunk.get("timestamp") or "н/д"))
+        similarity = float(chunk.get("similarity_score") or 0)
+        excerpt = html.escape((chunk.get("text") or "")[:200] + "...")
+        blocks.append(
+            f"**{i}. {meeting_info}** ({speaker} @ {timestamp}) *[схожесть: {similarity:.3f}]*  \n"
+            f"<small>{excerpt}</small>"
+        )
+    return "\n\n".join(blocks)
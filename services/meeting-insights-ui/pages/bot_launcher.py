@@ -2,7 +2,8 @@ import os
 import re
 import httpx
 import streamlit as st
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
 
 # Configuration
 # Use internal Docker service names when running in containers
@@ -12,130 +13,142 @@ EMAIL_NOTIFIER_URL = os.getenv("EMAIL_NOTIFIER_URL", "http://email-notifier:8003
 # SMTP email is for SENDING emails (configured in .env)
 SMTP_USER = os.getenv("SMTP_USER", "")
 
+ADMIN_HEADERS = {"X-Admin-API-Key": ADMIN_API_TOKEN}
+
 st.set_page_config(page_title="Запуск бота", layout="wide")
 st.title("🤖 AI Scrum Master • Запуск бота для встречи")
 
 
+# Patterns:
+# https://meet.google.com/xxx-yyyy-zzz
+# meet.google.com/xxx-yyyy-zzz
+# xxx-yyyy-zzz
+MEET_ID_PATTERNS = (
+    re.compile(r'meet\.google\.com/([a-z]{3}-[a-z]{4}-[a-z]{3})', re.IGNORECASE),
+    re.compile(r'([a-z]{3}-[a-z]{4}-[a-z]{3})', re.IGNORECASE),
+)
+
+
+@st.cache_resource(show_spinner=False)
+def get_gateway_client() -> httpx.Client:
+    """
+    Keep-alive client bound to the API gateway, reused by every call on this page.
+    Auth headers stay per call: admin endpoints get ADMIN_HEADERS, /bots the user token.
+    """
+    return httpx.Client(
+        base_url=API_GATEWAY_URL,
+        timeout=10.0,
+        transport=httpx.HTTPTransport(
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+            retries=2,  # retries connection failures only
+        ),
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def get_launch_pool() -> ThreadPoolExecutor:
+    """Small pool shared across reruns for the independent launch requests."""
+    return ThreadPoolExecutor(max_workers=4)
+
+
 def parse_google_meet_id(url: str) -> Optional[str]:
     """Extract meeting ID from Google Meet URL."""
-    # Patterns: 
-    # https://meet.google.com/xxx-yyyy-zzz
-    # meet.google.com/xxx-yyyy-zzz
-    # xxx-yyyy-zzz
-    patterns = [
-        r'meet\.google\.com/([a-z]{3}-[a-z]{4}-[a-z]{3})',
-        r'([a-z]{3}-[a-z]{4}-[a-z]{3})',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url.lower())
+    for pattern in MEET_ID_PATTERNS:
+        match = pattern.search(url)
         if match:
-            return match.group(1)
+            # Meet codes are lowercase; only the short match is normalised
+            return match.group(1).lower()
     return None
 
 
 def get_or_create_user(email: str) -> Optional[dict]:
     """Get or create user and return user data."""
     try:
-        with httpx.Client() as client:
-            response = client.post(
-                f"{API_GATEWAY_URL}/admin/users",
-                headers={
-                    "Content-Type": "application/json",
-                    "X-Admin-API-Key": ADMIN_API_TOKEN
-                },
-                json={
-                    "email": email,
-                    "max_concurrent_bots": 2
-                },
-                timeout=10.0
-            )
-            if response.status_code in [200, 201]:
-                return response.json()
-            else:
-                st.error(f"Ошибка создания пользователя: {response.status_code} - {response.text}")
-                return None
+        response = get_gateway_client().post(
+            "/admin/users",
+            headers=ADMIN_HEADERS,
+            json={
+                "email": email,
+                "max_concurrent_bots": 2
+            },
+        )
+        if response.status_code in [200, 201]:
+            return response.json()
+        else:
+            st.error(f"Ошибка создания пользователя: {response.status_code} - {response.text}")
+            return None
     except Exception as e:
         st.error(f"Ошибка при обращении к API: {e}")
         return None
 
 
-def create_user_token(user_id: int) -> Optional[str]:
-    """Create API token for user."""
+def create_user_token(client: httpx.Client, user_id: int) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Create API token for user. Returns (token, error).
+    Runs on the launch pool, so it takes the gateway client resolved on the
+    script thread and reports errors instead of calling st.*.
+    """
     try:
-        with httpx.Client() as client:
-            response = client.post(
-                f"{API_GATEWAY_URL}/admin/users/{user_id}/tokens",
-                headers={
-                    "X-Admin-API-Key": ADMIN_API_TOKEN
-                },
-                timeout=10.0
-            )
-            if response.status_code == 201:
-                token_data = response.json()
-                return token_data.get("token")
-            else:
-                st.error(f"Ошибка создания токена: {response.status_code} - {response.text}")
-                return None
+        response = client.post(
+            f"/admin/users/{user_id}/tokens",
+            headers=ADMIN_HEADERS,
+        )
+        if response.status_code == 201:
+            token_data = response.json()
+            return token_data.get("token"), None
+        return None, f"Ошибка создания токена: {response.status_code} - {response.text}"
     except Exception as e:
-        st.error(f"Ошибка при создании токена: {e}")
-        return None
+        return None, f"Ошибка при создании токена: {e}"
 
 
 def launch_bot(meeting_id: str, user_token: str, bot_name: str = "Scrum Recorder") -> Optional[dict]:
     """Launch bot for meeting."""
     try:
-        with httpx.Client() as client:
-            response = client.post(
-                f"{API_GATEWAY_URL}/bots",
-                headers={
-                    "Content-Type": "application/json",
-                    "X-API-Key": user_token
-                },
-                json={
-                    "platform": "google_meet",
-                    "native_meeting_id": meeting_id,
-                    "display_name": bot_name
-                },
-                timeout=30.0
-            )
-            if response.status_code == 201:
-                return response.json()
-            else:
-                st.error(f"Ошибка запуска бота: {response.status_code} - {response.text}")
-                return None
+        response = get_gateway_client().post(
+            "/bots",
+            headers={"X-API-Key": user_token},
+            json={
+                "platform": "google_meet",
+                "native_meeting_id": meeting_id,
+                "display_name": bot_name
+            },
+            timeout=30.0
+        )
+        if response.status_code == 201:
+            return response.json()
+        else:
+            st.error(f"Ошибка запуска бота: {response.status_code} - {response.text}")
+            return None
     except Exception as e:
         st.error(f"Ошибка при запуске бота: {e}")
         return None
 
 
-def update_email_notifier_config(email: str, user_id: int) -> bool:
-    """Update email notifier target email via user data."""
+def update_email_notifier_config(
+    client: httpx.Client, email: str, user_id: int
+) -> Tuple[bool, Optional[str]]:
+    """
+    Update email notifier target email via user data. Returns (ok, error).
+    Runs on the launch pool, so it takes the gateway client resolved on the
+    script thread and reports errors instead of calling st.*.
+    """
     try:
         # Store email preference in user data via admin API
         # This will be used by email-notifier to send emails
-        with httpx.Client() as client:
-            response = client.patch(
-                f"{API_GATEWAY_URL}/admin/users/{user_id}",
-                headers={
-                    "Content-Type": "application/json",
-                    "X-Admin-API-Key": ADMIN_API_TOKEN
-                },
-                json={
-                    "data": {
-                        "notification_email": email
-                    }
-                },
-                timeout=10.0
-            )
-            if response.status_code == 200:
-                return True
-            else:
-                st.warning(f"Не удалось обновить настройки email: {response.status_code}")
-                return False
+        response = client.patch(
+            f"/admin/users/{user_id}",
+            headers=ADMIN_HEADERS,
+            json={
+                "data": {
+                    "notification_email": email
+                }
+            },
+        )
+        if response.status_code == 200:
+            return True, None
+        return False, f"Не удалось обновить настройки email: {response.status_code}"
     except Exception as e:
-        st.warning(f"Не удалось обновить настройки email: {e}")
-        return False
+        return False, f"Не удалось обновить настройки email: {e}"
 
 
 # Initialize session state
@@ -147,70 +160,71 @@ if "target_email" not in st.session_state:
     st.session_state.target_email = None
 
 # Main UI
-st.markdown("### Шаг 1: Введите данные")
+# Inputs live in a form so typing does not rerun the page; everything below
+# runs once per submit.
+with st.form("launch_bot"):
+    st.markdown("### Шаг 1: Введите данные")
 
-col1, col2 = st.columns(2)
+    col1, col2 = st.columns(2)
 
-with col1:
-    meet_url = st.text_input(
-        "🔗 Ссылка на Google Meet",
-        placeholder="https://meet.google.com/xxx-yyyy-zzz",
-        help="Вставьте полную ссылку на встречу или только ID встречи"
-    )
+    with col1:
+        meet_url = st.text_input(
+            "🔗 Ссылка на Google Meet",
+            placeholder="https://meet.google.com/xxx-yyyy-zzz",
+            help="Вставьте полную ссылку на встречу или только ID встречи"
+        )
 
-with col2:
-    # Use SMTP_USER as default if available, otherwise empty
-    default_account_email = st.session_state.user_email or SMTP_USER or ""
-    user_email_input = st.text_input(
-        "📧 Email для аккаунта",
-        value=default_account_email,
-        placeholder="your.email@example.com",
-        help="Email для создания/поиска вашего аккаунта в системе. Используется для авторизации и управления ботами. По умолчанию используется SMTP_USER из .env файла."
-    )
+    with col2:
+        # Use SMTP_USER as default if available, otherwise empty
+        default_account_email = st.session_state.user_email or SMTP_USER or ""
+        user_email_input = st.text_input(
+            "📧 Email для аккаунта",
+            value=default_account_email,
+            placeholder="your.email@example.com",
+            help="Email для создания/поиска вашего аккаунта в системе. Используется для авторизации и управления ботами. По умолчанию используется SMTP_USER из .env файла."
+        )
 
-st.markdown("### Шаг 2: Настройки")
+    st.markdown("### Шаг 2: Настройки")
 
-col3, col4 = st.columns(2)
+    col3, col4 = st.columns(2)
 
-with col3:
-    bot_name = st.text_input(
-        "🤖 Имя бота в встрече",
-        value="Scrum Recorder",
-        help="Имя, которое будет отображаться в списке участников"
-    )
+    with col3:
+        bot_name = st.text_input(
+            "🤖 Имя бота в встрече",
+            value="Scrum Recorder",
+            help="Имя, которое будет отображаться в списке участников"
+        )
 
-with col4:
-    # Default to account email or SMTP_USER
-    default_notification_email = st.session_state.target_email or user_email_input or SMTP_USER or ""
-    target_email = st.text_input(
-        "📬 Email для уведомлений (получатель)",
-        value=default_notification_email,
-        placeholder="notifications@example.com",
-        help="Email, НА КОТОРЫЙ будут отправляться письма с инсайтами (получатель). SMTP_USER из .env используется как ОТПРАВИТЕЛЬ. Если не указан, будет использован email аккаунта."
-    )
+    with col4:
+        # Default to account email or SMTP_USER
+        default_notification_email = st.session_state.target_email or user_email_input or SMTP_USER or ""
+        target_email = st.text_input(
+            "📬 Email для уведомлений (получатель)",
+            value=default_notification_email,
+            placeholder="notifications@example.com",
+            help="Email, НА КОТОРЫЙ будут отправляться письма с инсайтами (получатель). SMTP_USER из .env используется как ОТПРАВИТЕЛЬ. Если не указан, будет использован email аккаунта."
+        )
+
+    # Launch button
+    submitted = st.form_submit_button("🚀 Запустить бота", type="primary")
 
 st.divider()
 
-# Parse meeting ID
-meeting_id = None
-if meet_url:
-    meeting_id = parse_google_meet_id(meet_url)
-    if meeting_id:
-        st.success(f"✅ ID встречи: `{meeting_id}`")
-    else:
-        st.error("❌ Не удалось распознать ID встречи. Проверьте формат ссылки.")
+if not submitted:
+    st.info("👆 Введите ссылку на Google Meet встречу и нажмите «Запустить бота»")
 else:
-    st.info("👆 Введите ссылку на Google Meet встречу")
+    # Parse meeting ID
+    meeting_id = parse_google_meet_id(meet_url) if meet_url else None
 
-# Launch button
-if st.button("🚀 Запустить бота", type="primary", disabled=not (meeting_id and user_email_input)):
     if not ADMIN_API_TOKEN:
         st.error("❌ ADMIN_API_TOKEN не настроен. Обратитесь к администратору.")
         st.stop()
     
     if not meeting_id:
-        st.error("❌ Не удалось распознать ID встречи")
+        st.error("❌ Не удалось распознать ID встречи. Проверьте формат ссылки.")
         st.stop()
+
+    st.success(f"✅ ID встречи: `{meeting_id}`")
     
     if not user_email_input:
         st.error("❌ Введите ваш email")
@@ -232,30 +246,39 @@ if st.button("🚀 Запустить бота", type="primary", disabled=not (m
     user_id = user_data.get("id")
     st.session_state.user_email = user_email_input
     
-    # Step 2: Get or create token
-    status_text.text("🔑 Получение токена доступа...")
+    # Steps 2 and 3 only need user_id, so the token and the email settings
+    # requests run concurrently; st.* calls, cached resources included, stay on
+    # the script thread.
+    status_text.text("🔑 Получение токена доступа и настройка уведомлений...")
     progress_bar.progress(40)
-    
+    pool = get_launch_pool()
+    client = get_gateway_client()
+
     # Try to get existing token or create new one
     user_token = st.session_state.user_token
-    if not user_token:
-        user_token = create_user_token(user_id)
+    token_future = None if user_token else pool.submit(create_user_token, client, user_id)
+    email_future = pool.submit(update_email_notifier_config, client, target_email, user_id) if target_email else None
+
+    if token_future:
+        user_token, token_error = token_future.result()
+        if token_error:
+            st.error(token_error)
         if user_token:
             st.session_state.user_token = user_token
-    
-    if not user_token:
-        st.error("❌ Не удалось получить токен доступа")
-        st.stop()
-    
-    # Step 3: Update email notifier config
-    if target_email:
-        status_text.text("📧 Настройка email уведомлений...")
-        progress_bar.progress(60)
+
+    if email_future:
         st.session_state.target_email = target_email
-        if update_email_notifier_config(target_email, user_id):
+        email_saved, email_error = email_future.result()
+        progress_bar.progress(60)
+        if email_saved:
             st.info(f"📬 Уведомления будут отправляться на: {target_email}")
         else:
+            st.warning(email_error)
             st.warning(f"⚠️ Не удалось сохранить настройки email, но бот будет запущен")
+
+    if not user_token:
+        st.error("❌ Не удалось получить токен доступа")
+        st.stop()
     
     # Step 4: Launch bot
     status_text.text("🚀 Запуск бота...")
@@ -1,76 +1,58 @@
 import os
 import json
+from collections import deque
+from itertools import islice
 from typing import List, Optional, Dict, Any
 
 import streamlit as st
 import httpx
-from sqlalchemy.orm import sessionmaker
 
-from shared_models.database import sync_engine
-from shared_models.models import Meeting, MeetingMetadata
-from sqlalchemy import select
-
-
-SessionLocal = sessionmaker(bind=sync_engine)
+from insights_common import fetch_meetings, format_citations
 
 RAG_API_URL = os.environ.get("RAG_API_URL", "http://meeting-insights-worker:8002")
 
 st.set_page_config(page_title="Чат", layout="wide")
 st.title("💬 AI Scrum Master • Чат")
 
+CHAT_HISTORY_LIMIT = 50  # messages kept in the session
+CONVERSATION_CONTEXT = 10  # latest messages sent to the RAG API
+
 # Initialize session state for chat
 if "chat_history" not in st.session_state:
-    st.session_state.chat_history = []
+    st.session_state.chat_history = deque(maxlen=CHAT_HISTORY_LIMIT)
 if "chat_mode" not in st.session_state:
     st.session_state.chat_mode = "global"
 if "selected_meeting_for_chat" not in st.session_state:
     st.session_state.selected_meeting_for_chat = None
 
 
-def fetch_meetings():
-    """Fetch list of processed meetings."""
-    with SessionLocal() as session:
-        stmt = (
-            select(Meeting, MeetingMetadata)
-            .join(MeetingMetadata, MeetingMetadata.meeting_id == Meeting.id, isouter=True)
-            .where(Meeting.summary_state.in_(["completed", "no_data"]))
-            .order_by(Meeting.start_time.desc().nullslast())
-        )
-        records = session.execute(stmt).all()
-        result = []
-        for meeting, metadata in records:
-            label = meeting.platform_specific_id or f"Meeting #{meeting.id}"
-            if meeting.start_time:
-                label = f"{label} ({meeting.start_time.isoformat()})"
-            result.append(
-                {
-                    "id": meeting.id,
-                    "label": label,
-                    "meeting": meeting,
-                    "metadata": metadata,
-                }
-            )
-        return result
+@st.cache_resource(show_spinner=False)
+def get_rag_client() -> httpx.Client:
+    """Keep-alive client for the RAG API, shared across reruns and sessions."""
+    return httpx.Client(
+        base_url=RAG_API_URL,
+        timeout=60.0,
+        transport=httpx.HTTPTransport(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0),
+            retries=2,  # retries connection failures only
+        ),
+    )
 
 
 def call_rag_api(query: str, mode: str, meeting_id: Optional[int] = None, conversation: List[Dict[str, str]] = None) -> Dict[str, Any]:
     """Call the RAG API endpoint."""
     try:
-        with httpx.Client(timeout=60.0) as client:
-            payload = {
-                "query": query,
-                "mode": mode,
-                "conversation": conversation or [],
-            }
-            if meeting_id:
-                payload["meeting_id"] = meeting_id
-            
-            response = client.post(
-                f"{RAG_API_URL}/rag/query",
-                json=payload,
-            )
-            response.raise_for_status()
-            return response.json()
+        payload = {
+            "query": query,
+            "mode": mode,
+            "conversation": conversation or [],
+        }
+        if meeting_id:
+            payload["meeting_id"] = meeting_id
+        
+        response = get_rag_client().post("/rag/query", json=payload)
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPError as e:
         st.error(f"Failed to call RAG API: {e}")
         return {"answer": "Ошибка при обращении к API.", "chunks": [], "token_usage": None}
@@ -91,6 +73,8 @@ with col1:
 # Meeting selector for Ask mode
 selected_meeting_id = None
 if chat_mode == "Ask the Meeting":
+    if st.button("🔄 Обновить список встреч"):
+        fetch_meetings.clear()
     meetings = fetch_meetings()
     if not meetings:
         st.warning("Нет обработанных встреч. Убедитесь, что worker сгенерировал инсайты.")
@@ -108,76 +92,74 @@ if chat_mode == "Ask the Meeting":
 # Chat history display
 st.divider()
 
-# Display chat history
-for msg in st.session_state.chat_history:
-    role = msg.get("role", "user")
-    content = msg.get("content", "")
-    chunks = msg.get("chunks", [])
-    
-    if role == "user":
-        with st.chat_message("user"):
-            st.write(content)
-    else:
-        with st.chat_message("assistant"):
-            st.write(content)
-            
-            # Show citations if available
-            if chunks:
-                with st.expander(f"📎 Источники ({len(chunks)})"):
-                    for i, chunk in enumerate(chunks, 1):
-                        meeting_info = chunk.get("meeting_native_id") or f"Meeting #{chunk.get('meeting_id')}"
-                        speaker = chunk.get("speaker") or "Неизвестно"
-                        timestamp = chunk.get("timestamp") or "н/д"
-                        similarity = chunk.get("similarity_score", 0)
-                        
-                        st.markdown(
-                            f"**{i}. {meeting_info}** ({speaker} @ {timestamp}) "
-                            f"*[схожесть: {similarity:.3f}]*"
-                        )
-                        st.caption(chunk.get("text", "")[:200] + "...")
-
-# Chat input
-query = st.chat_input("Задайте вопрос о встречах...")
-
-if query:
-    # Add user message to history
-    st.session_state.chat_history.append({
-        "role": "user",
-        "content": query,
-    })
-    
-    # Prepare conversation history for API
-    conversation = [
-        {"role": msg["role"], "content": msg["content"]}
-        for msg in st.session_state.chat_history[-10:]  # Last 10 messages
-    ]
-    
-    # Determine mode
-    mode = "meeting" if chat_mode == "Ask the Meeting" else "global"
-    
-    # Show loading
-    with st.spinner("Ищу ответ..."):
-        # Call RAG API
-        result = call_rag_api(
-            query=query,
-            mode=mode,
-            meeting_id=selected_meeting_id,
-            conversation=conversation[:-1],  # Exclude current query
-        )
-        
-        # Add assistant response to history
+
+@st.fragment
+def chat_fragment(mode: str, meeting_id: Optional[int]):
+    """
+    History, input and clear button rerun on their own: sending a message does
+    not re-run the mode/meeting selectors or fetch_meetings above.
+    """
+    # Display chat history
+    for msg in st.session_state.chat_history:
+        role = msg.get("role", "user")
+        content = msg.get("content", "")
+
+        if role == "user":
+            with st.chat_message("user"):
+                st.write(content)
+        else:
+            with st.chat_message("assistant"):
+                st.write(content)
+
+                # Show citations if available
+                citations = msg.get("citations")
+                if citations:
+                    with st.expander(f"📎 Источники ({msg['citation_count']})"):
+                        st.markdown(citations, unsafe_allow_html=True)
+
+    # Chat input
+    query = st.chat_input("Задайте вопрос о встречах...")
+
+    if query:
+        # Add user message to history
         st.session_state.chat_history.append({
-            "role": "assistant",
-            "content": result.get("answer", "Не удалось получить ответ."),
-            "chunks": result.get("chunks", []),
+            "role": "user",
+            "content": query,
         })
-    
-    # Rerun to display new messages
-    st.rerun()
 
-# Clear chat button
-if st.session_state.chat_history:
-    if st.button("🗑️ Очистить историю чата"):
-        st.session_state.chat_history = []
-        st.rerun()
+        # Prepare conversation history for API
+        history = st.session_state.chat_history
+        conversation = [
+            {"role": msg["role"], "content": msg["content"]}
+            for msg in islice(history, max(0, len(history) - CONVERSATION_CONTEXT), None)
+        ]
+
+        # Show loading
+        with st.spinner("Ищу ответ..."):
+            # Call RAG API
+            result = call_rag_api(
+                query=query,
+                mode=mode,
+                meeting_id=meeting_id,
+                conversation=conversation[:-1],  # Exclude current query
+            )
+
+            # Add assistant response to history
+            st.session_state.chat_history.append({
+                "role": "assistant",
+                "content": result.get("answer", "Не удалось получить ответ."),
+                "citations": format_citations(result.get("chunks", [])),
+                "citation_count": len(result.get("chunks", [])),
+            })
+
+        # Rerun to display new messages
+        st.rerun(scope="fragment")
+
+    # Clear chat button
+    if st.session_state.chat_history:
+        if st.button("🗑️ Очистить историю чата"):
+            st.session_state.chat_history.clear()
+            st.rerun(scope="fragment")
+
 
+chat_fragment("meeting" if chat_mode == "Ask the Meeting" else "global", selected_meeting_id)
@@ -0,0 +1,35 @@
+import unittest
+
+from insights_common import format_citations
+
+
+class TestFormatCitations(unittest.TestCase):
+    def test_escapes_every_field(self):
+        citations = format_citations([
+            {
+                "meeting_native_id": "<b>abc</b>",
+                "speaker": "<script>alert(1)</script>",
+                "timestamp": "<i>10:00</i>",
+                "similarity_score": 0.5,
+                "text": "<img src=x onerror=alert(1)>",
+            }
+        ])
+        for markup in ("<b>", "<script>", "<i>", "<img"):
+            self.assertNotIn(markup, citations)
+        self.assertIn("&lt;script&gt;alert(1)&lt;/script&gt;", citations)
+        self.assertIn("&lt;img src=x onerror=alert(1)&gt;", citations)
+
+    def test_missing_fields_use_defaults(self):
+        citations = format_citations([{"meeting_id": 7}])
+        self.assertIn("**1. Meeting #7**", citations)
+        self.assertIn("(Неизвестно @ н/д)", citations)
+        self.assertIn("[схожесть: 0.000]", citations)
+
+    def test_one_block_per_chunk(self):
+        citations = format_citations([{"meeting_id": 1, "text": "a"}, {"meeting_id": 2, "text": "b"}])
+        self.assertEqual(len(citations.split("\n\n")), 2)
+        self.assertEqual(format_citations([]), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,18 +1,25 @@
-import json
+import hashlib
 import logging
 import os
+import select as select_module
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Dict, List, Optional, Sequence
 import httpx
+import orjson
 
-from openai import OpenAI
-from sqlalchemy import select
-from sqlalchemy.orm import Session, sessionmaker
+from openai import DefaultHttpxClient, OpenAI
+from sqlalchemy import Row, delete, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, joinedload, sessionmaker
 
 from shared_models.database import sync_engine
 from shared_models.models import (
     ActionItem,
+    EmbeddingCache,
+    InsightsCache,
     Meeting,
     MeetingMetadata,
     SpeakerHighlight,
@@ -37,92 +44,151 @@ if not OPENAI_API_KEY:
 
 SUMMARY_MODEL = os.environ.get("OPENAI_SUMMARY_MODEL", "gpt-5-nano")
 EMBEDDING_MODEL = os.environ.get("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small")
+# Inputs and estimated tokens per embeddings request (API limits: 2048 inputs, 300k tokens)
+EMBEDDING_BATCH_SIZE = int(os.environ.get("INSIGHTS_EMBEDDING_BATCH_SIZE", "2048"))
+EMBEDDING_BATCH_TOKENS = int(os.environ.get("INSIGHTS_EMBEDDING_BATCH_TOKENS", "280000"))
+# Embeddings requests in flight at once when a meeting needs several batches
+EMBEDDING_CONCURRENCY = int(os.environ.get("INSIGHTS_EMBEDDING_CONCURRENCY", "5"))
 POLL_INTERVAL = int(os.environ.get("INSIGHTS_POLL_INTERVAL", "30"))
-BATCH_SIZE = int(os.environ.get("INSIGHTS_BATCH_SIZE", "1"))
+BATCH_SIZE = int(os.environ.get("INSIGHTS_BATCH_SIZE", "4"))
 TARGET_STATUSES = [
     status.strip()
     for status in os.environ.get("INSIGHTS_TARGET_STATUSES", "completed").split(",")
     if status.strip()
 ]
 SEGMENT_LIMIT = int(os.environ.get("INSIGHTS_SEGMENT_LIMIT", "300"))
+# Estimated tokens of transcript lines sent to the summary model
+PROMPT_TOKEN_BUDGET = int(os.environ.get("INSIGHTS_PROMPT_TOKEN_BUDGET", "20000"))
+# Backchannel replies that carry no content for the summary
+FILLER_PHRASES = frozenset({"да", "угу", "ага", "ок", "окей", "ну", "понятно", "хорошо", "мгм"})
 TEAM_ROSTER_PATH = os.environ.get("TEAM_ROSTER_PATH", "team_roster.txt")
+NOTIFY_CHANNEL = "meetings_ready"
+# Services told about each processed meeting (POST {"meeting_id": ...})
+DOWNSTREAM_TRIGGERS = (
+    ("Email notification", f"{os.environ.get('EMAIL_NOTIFIER_URL', 'http://email-notifier:8003')}/trigger"),
+    ("Jira sync", f"{os.environ.get('JIRA_SYNC_URL', 'http://jira-sync-worker:8004')}/trigger"),
+)
 
-client = OpenAI(api_key=OPENAI_API_KEY)
-
+# Summary and embedding calls share one keep-alive HTTP/2 pool (embedding batches run concurrently)
+client = OpenAI(
+    api_key=OPENAI_API_KEY,
+    http_client=DefaultHttpxClient(
+        http2=True,
+        timeout=httpx.Timeout(60.0, connect=10.0),
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=40, keepalive_expiry=30.0),
+    ),
+)
 
-def chunk_list(items: List[Any], chunk_size: int) -> List[List[Any]]:
-    return [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+# Keep-alive client for the downstream /trigger calls
+trigger_client = httpx.Client(timeout=5.0)
 
 
-def select_next_meeting(session: Session) -> Optional[Meeting]:
-    stmt = (
-        select(Meeting)
+def claim_meetings(session: Session, limit: int) -> List[int]:
+    """
+    Claim up to `limit` meetings awaiting insights in one UPDATE ... RETURNING:
+    rows are picked with FOR UPDATE SKIP LOCKED (oldest first), marked
+    'processing' and committed, so concurrent workers never get the same meeting.
+    """
+    pending = (
+        select(Meeting.id)
         .where(
             Meeting.status.in_(TARGET_STATUSES),
             Meeting.summary_state.in_(["pending", "error", None]),
         )
         .order_by(Meeting.updated_at.asc())
         .with_for_update(skip_locked=True)
-        .limit(1)
+        .limit(limit)
     )
-    meeting = session.execute(stmt).scalars().first()
-    if meeting:
-        meeting.summary_state = "processing"
-        session.commit()
-        session.refresh(meeting)
-    return meeting
+    claim = (
+        update(Meeting)
+        .where(Meeting.id.in_(pending))
+        .values(summary_state="processing")
+        .returning(Meeting.id)
+    )
+    meeting_ids = session.execute(
+        claim, execution_options={"synchronize_session": False}
+    ).scalars().all()
+    session.commit()
+    return list(meeting_ids)
 
 
-def build_transcript_payload(meeting: Meeting, segments: List[Transcription]) -> str:
-    lines = []
+def load_claimed_meeting(session: Session, meeting_id: int) -> Meeting:
+    """Claimed meeting together with metadata_record (used by persist_insights)."""
+    return session.execute(
+        select(Meeting)
+        .options(joinedload(Meeting.metadata_record))
+        .where(Meeting.id == meeting_id)
+    ).scalar_one()
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // 4 + 1
+
+
+def build_transcript_payload(meeting: Meeting, segments: Sequence[Row]) -> str:
+    """
+    Numbered transcript lines for the summary prompt: filler replies are skipped and
+    output stops at SEGMENT_LIMIT lines or PROMPT_TOKEN_BUDGET estimated tokens.
+    """
     base_time = meeting.start_time
-    for idx, segment in enumerate(segments[:SEGMENT_LIMIT], start=1):
-        speaker = segment.speaker or "Unknown"
-        rel_window = f"{segment.start_time:.2f}-{segment.end_time:.2f}s"
-        abs_time = (
-            (base_time + timedelta(seconds=segment.start_time)).isoformat()
-            if base_time
-            else "n/a"
-        )
-        lines.append(
-            f"{idx}. [{rel_window} | {abs_time}] {speaker}: {segment.text.strip()}"
+    lines = []
+    append = lines.append
+    tokens = 0
+    content = (
+        segment for segment in segments
+        if segment.text.strip().lower().strip(".,!?… ") not in FILLER_PHRASES
+    )
+    for idx, (speaker, start_time, end_time, text, _language) in enumerate(
+        islice(content, SEGMENT_LIMIT), start=1
+    ):
+        abs_time = (base_time + timedelta(seconds=start_time)).isoformat() if base_time else "n/a"
+        line = (
+            f"{idx}. [{start_time:.2f}-{end_time:.2f}s | {abs_time}] "
+            f"{speaker or 'Unknown'}: {text.strip()}"
         )
+        tokens += estimate_tokens(line)
+        if lines and tokens > PROMPT_TOKEN_BUDGET:
+            break
+        append(line)
     return "\n".join(lines)
 
 
+# Roster text keyed by file mtime, so edits are picked up without a restart
+_TEAM_CONTEXT_CACHE: Dict[str, Any] = {"mtime": None, "data": None}
+
+
 def load_team_context() -> Optional[str]:
     if not TEAM_ROSTER_PATH:
         return None
     try:
-        with open(TEAM_ROSTER_PATH, "r", encoding="utf-8") as roster_file:
-            data = roster_file.read().strip()
-            return data or None
+        mtime = os.stat(TEAM_ROSTER_PATH).st_mtime
+        if mtime != _TEAM_CONTEXT_CACHE["mtime"]:
+            with open(TEAM_ROSTER_PATH, "r", encoding="utf-8") as roster_file:
+                _TEAM_CONTEXT_CACHE["data"] = roster_file.read().strip() or None
+            _TEAM_CONTEXT_CACHE["mtime"] = mtime
+        return _TEAM_CONTEXT_CACHE["data"]
     except FileNotFoundError:
         logger.warning("Team roster file %s not found; continuing without roster context", TEAM_ROSTER_PATH)
         return None
 
 
-def build_insights_prompt(
-    meeting: Meeting,
-    transcript_payload: str,
-    team_context: Optional[str],
-) -> List[Dict[str, str]]:
-    system_prompt = (
-        "Ты — русскоязычный AI Scrum Master ForteBank. "
-        "Анализируй стенограммы встреч, выделяй бизнес-эффект, риски, ответственных и план действий. "
-        "Пиши в деловом стиле, чтобы результаты можно было сразу переносить в дашборды.\n\n"
-        "ВАЖНО: Транскрипты могут содержать галлюцинации (ошибочные или нерелевантные фразы, появившиеся из-за ошибок распознавания речи). "
-        "Игнорируй любой текст из транскрипта, который:\n"
-        "- Не относится к теме встречи или деловой тематике\n"
-        "- Выглядит бессмысленным или нелогичным\n"
-        "- Не соответствует контексту обсуждения\n"
-        "- Содержит случайные слова или фразы, не связанные с бизнес-контекстом\n"
-        "- Является техническими артефактами распознавания (например, повторяющиеся символы, тестовые фразы)\n\n"
-        "Используй только релевантный, осмысленный контекст, который логично связан с деловой тематикой встречи. "
-        "Если фраза выглядит подозрительно или не относится к обсуждаемой теме, исключи её из анализа."
-    )
+# Static parts of the insights prompt; only the meeting/transcript message is built per call
+INSIGHTS_SYSTEM_PROMPT = (
+    "Ты — русскоязычный AI Scrum Master ForteBank. "
+    "Анализируй стенограммы встреч, выделяй бизнес-эффект, риски, ответственных и план действий. "
+    "Пиши в деловом стиле, чтобы результаты можно было сразу переносить в дашборды.\n\n"
+    "ВАЖНО: Транскрипты могут содержать галлюцинации (ошибочные или нерелевантные фразы, появившиеся из-за ошибок распознавания речи). "
+    "Игнорируй любой текст из транскрипта, который:\n"
+    "- Не относится к теме встречи или деловой тематике\n"
+    "- Выглядит бессмысленным или нелогичным\n"
+    "- Не соответствует контексту обсуждения\n"
+    "- Содержит случайные слова или фразы, не связанные с бизнес-контекстом\n"
+    "- Является техническими артефактами распознавания (например, повторяющиеся символы, тестовые фразы)\n\n"
+    "Используй только релевантный, осмысленный контекст, который логично связан с деловой тематикой встречи. "
+    "Если фраза выглядит подозрительно или не относится к обсуждаемой теме, исключи её из анализа."
+)
 
-    schema_description = """
+INSIGHTS_SCHEMA_DESCRIPTION = """
 Верни JSON строго в следующей структуре (все поля на русском языке):
 {
   "overview": {
@@ -219,6 +285,12 @@ def build_insights_prompt(
 }
 """
 
+
+def build_insights_prompt(
+    meeting: Meeting,
+    transcript_payload: str,
+    team_context: Optional[str],
+) -> List[Dict[str, str]]:
     roster_section = (
         f"\nСостав команды и роли (из текстового файла):\n{team_context}\n"
         if team_context
@@ -252,20 +324,18 @@ def build_insights_prompt(
 """
 
     return [
-        {"role": "system", "content": system_prompt},
-        {"role": "user", "content": schema_description},
+        {"role": "system", "content": INSIGHTS_SYSTEM_PROMPT},
+        {"role": "user", "content": INSIGHTS_SCHEMA_DESCRIPTION},
         {"role": "user", "content": user_prompt},
     ]
 
 
-def call_summary_model(messages: List[Dict[str, str]]) -> Dict[str, Any]:
+def extract_output_text(response: Any) -> str:
     """
-    Calls the Responses API and returns the parsed JSON payload. Newer versions of
-    openai-python (>=2.8.x) expose `response.output_text`, but the SDK may also
-    stream structured content blocks. This helper normalizes both cases.
+    Text of a completed Responses API object. Newer versions of openai-python
+    (>=2.8.x) expose `response.output_text`, but the SDK may also return
+    structured content blocks. This helper normalizes both cases.
     """
-    response = client.responses.create(model=SUMMARY_MODEL, input=messages)
-
     text_payload = getattr(response, "output_text", None)
 
     if not text_payload:
@@ -281,20 +351,118 @@ def call_summary_model(messages: List[Dict[str, str]]) -> Dict[str, Any]:
                     chunks.append(value)
         text_payload = "".join(chunks).strip()
 
-    if not text_payload:
-        raise RuntimeError(f"Unexpected response format: {response}")
+    return text_payload
+
 
-    return json.loads(text_payload)
+def call_summary_model(messages: List[Dict[str, str]]) -> Dict[str, Any]:
+    """
+    Streams the Responses API and returns the parsed JSON payload. Output text
+    deltas are accumulated as they arrive, so a long generation keeps the
+    connection active instead of idling until the end; the final response object
+    is only used when no text deltas were streamed.
+    """
+    parts: List[str] = []
+    with client.responses.stream(model=SUMMARY_MODEL, input=messages) as stream:
+        for event in stream:
+            if event.type == "response.output_text.delta":
+                parts.append(event.delta)
+        text_payload = "".join(parts).strip()
+        if not text_payload:
+            response = stream.get_final_response()
+            text_payload = extract_output_text(response)
+            if not text_payload:
+                raise RuntimeError(f"Unexpected response format: {response}")
+
+    return orjson.loads(text_payload)
+
+
+def plan_embedding_batches(texts: List[str]) -> List[List[int]]:
+    """
+    Group text indices into request batches of at most EMBEDDING_BATCH_SIZE inputs
+    and ~EMBEDDING_BATCH_TOKENS tokens (see estimate_tokens), packing by length.
+    """
+    batches: List[List[int]] = []
+    current: List[int] = []
+    current_tokens = 0
+    for index in sorted(range(len(texts)), key=lambda i: len(texts[i])):
+        tokens = estimate_tokens(texts[index])
+        if current and (
+            len(current) >= EMBEDDING_BATCH_SIZE or current_tokens + tokens > EMBEDDING_BATCH_TOKENS
+        ):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(index)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
 
 
 def generate_embeddings(texts: List[str]) -> List[List[float]]:
-    embeddings: List[List[float]] = []
-    for chunk in chunk_list(texts, 50):
-        result = client.embeddings.create(model=EMBEDDING_MODEL, input=chunk)
-        embeddings.extend([data.embedding for data in result.data])
+    """
+    Embed texts in as few requests as possible (see plan_embedding_batches).
+    Batches are sent concurrently (up to EMBEDDING_CONCURRENCY); output keeps input order.
+    """
+    def embed_batch(indices: List[int]) -> List[List[float]]:
+        result = client.embeddings.create(model=EMBEDDING_MODEL, input=[texts[i] for i in indices])
+        return [data.embedding for data in result.data]
+
+    batches = plan_embedding_batches(texts)
+    embeddings: List[Optional[List[float]]] = [None] * len(texts)
+    with ThreadPoolExecutor(max_workers=max(1, min(EMBEDDING_CONCURRENCY, len(batches)))) as pool:
+        # map() yields in submission order; scatter each batch back to its input positions
+        for indices, batch_embeddings in zip(batches, pool.map(embed_batch, batches)):
+            for index, embedding in zip(indices, batch_embeddings):
+                embeddings[index] = embedding
     return embeddings
 
 
+def embed_texts_cached(session: Session, texts: List[str]) -> List[List[float]]:
+    """
+    generate_embeddings behind the embedding_cache table: texts are keyed by
+    (EMBEDDING_MODEL, sha256(text)), hits are read in one query and only distinct
+    misses are sent to the API. New vectors are written in their own short
+    transaction, in text_hash order: the caller's transaction stays open through
+    the LLM calls, and concurrent meetings sharing a text (e.g. "Да.") would
+    otherwise wait on, or deadlock over, each other's uncommitted cache rows.
+    """
+    hashes = [hashlib.sha256(text.encode("utf-8")).hexdigest() for text in texts]
+    unique_hashes = list(dict.fromkeys(hashes))
+    cached: Dict[str, List[float]] = {}
+    if unique_hashes:
+        rows = session.execute(
+            select(EmbeddingCache.text_hash, EmbeddingCache.embedding).where(
+                EmbeddingCache.model == EMBEDDING_MODEL,
+                EmbeddingCache.text_hash.in_(unique_hashes),
+            )
+        )
+        cached = {text_hash: embedding.to_list() for text_hash, embedding in rows}
+
+    misses = {text_hash: text for text_hash, text in zip(hashes, texts) if text_hash not in cached}
+    if misses:
+        miss_hashes = list(misses)
+        miss_embeddings = generate_embeddings([misses[text_hash] for text_hash in miss_hashes])
+        cached.update(zip(miss_hashes, miss_embeddings))
+        with sync_engine.begin() as connection:
+            connection.execute(
+                insert(EmbeddingCache)
+                .values(
+                    [
+                        {"model": EMBEDDING_MODEL, "text_hash": text_hash, "embedding": cached[text_hash]}
+                        for text_hash in sorted(miss_hashes)
+                    ]
+                )
+                .on_conflict_do_nothing()
+            )
+    logger.info(
+        "Embeddings: %s texts, %s distinct, %s from cache",
+        len(texts),
+        len(unique_hashes),
+        len(unique_hashes) - len(misses),
+    )
+    return [cached[text_hash] for text_hash in hashes]
+
+
 def parse_iso_datetime(value: Optional[str]) -> Optional[datetime]:
     if not value:
         return None
@@ -305,24 +473,17 @@ def parse_iso_datetime(value: Optional[str]) -> Optional[datetime]:
         return None
 
 
-def embed_structured_insights(
-    session: Session,
-    meeting: Meeting,
-    insights: Dict[str, Any],
-    client: OpenAI,
-) -> None:
+def build_structured_insight_chunks(insights: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
-    Create embeddings for structured insights content (overview, blockers, action items).
+    Texts to embed for structured insights content (overview, blockers, action items).
     These are stored as separate chunks with chunk_type='insight' or 'action_item'.
     """
-    texts_to_embed = []
     metadata_list = []
     
     # Embed overview
     overview = insights.get("overview", {})
     if overview:
         overview_text = f"Цель встречи: {overview.get('goal', '')}\nРезюме: {overview.get('summary', '')}\nНастроение: {overview.get('sentiment', '')}"
-        texts_to_embed.append(overview_text)
         metadata_list.append({
             'chunk_type': 'insight',
             'text': overview_text,
@@ -333,7 +494,6 @@ def embed_structured_insights(
     blockers = insights.get("blockers", [])
     for blocker in blockers:
         blocker_text = f"Блокер: {blocker.get('description', '')}\nВладелец: {blocker.get('owner', '')}\nВлияние: {blocker.get('impact', '')}"
-        texts_to_embed.append(blocker_text)
         metadata_list.append({
             'chunk_type': 'insight',
             'text': blocker_text,
@@ -344,7 +504,6 @@ def embed_structured_insights(
     deadlines = insights.get("critical_deadlines", [])
     for deadline in deadlines:
         deadline_text = f"Критичный срок: {deadline.get('name', '')}\nОтветственный: {deadline.get('owner', '')}\nДата: {deadline.get('date', '')}\nРиск: {deadline.get('risk', '')}"
-        texts_to_embed.append(deadline_text)
         metadata_list.append({
             'chunk_type': 'insight',
             'text': deadline_text,
@@ -355,65 +514,89 @@ def embed_structured_insights(
     action_items = insights.get("action_items", [])
     for item in action_items:
         action_text = f"Действие: {item.get('description', '')}\nОтветственный: {item.get('owner', '')}\nСрок: {item.get('due_date', '')}\nПриоритет: {item.get('priority', '')}"
-        texts_to_embed.append(action_text)
         metadata_list.append({
             'chunk_type': 'action_item',
             'text': action_text,
             'source': 'action_item',
         })
     
-    if not texts_to_embed:
-        return
-    
-    # Generate embeddings
-    embeddings_result = client.embeddings.create(
-        model=EMBEDDING_MODEL,
-        input=texts_to_embed
-    )
-    
+    return metadata_list
+
+
+def embed_structured_insights(
+    session: Session,
+    meeting: Meeting,
+    insight_chunks: List[Dict[str, Any]],
+    embeddings: List[List[float]],
+) -> None:
+    """Store embeddings of structured insight chunks (see build_structured_insight_chunks)."""
     meeting_date = meeting.start_time.date() if meeting.start_time else None
-    
-    # Store embeddings
-    for metadata, embedding_data in zip(metadata_list, embeddings_result.data):
-        chunk_hash = compute_chunk_hash(metadata['text'], meeting.id, metadata['chunk_type'])
-        
-        # Check if chunk already exists
-        existing = session.query(TranscriptEmbedding).filter_by(
-            meeting_id=meeting.id,
-            chunk_hash=chunk_hash
-        ).first()
-        
-        if existing:
-            # Update existing embedding
-            existing.embedding = embedding_data.embedding
-            existing.text = metadata['text']
-        else:
-            # Create new embedding
-            session.add(
-                TranscriptEmbedding(
-                    meeting_id=meeting.id,
-                    text=metadata['text'],
-                    embedding=embedding_data.embedding,
-                    chunk_type=metadata['chunk_type'],
-                    meeting_native_id=meeting.platform_specific_id,
-                    platform=meeting.platform,
-                    chunk_hash=chunk_hash,
-                    meeting_date=meeting_date,
-                    timestamp=meeting.start_time,
-                )
-            )
+    rows = [
+        {
+            "meeting_id": meeting.id,
+            "text": metadata['text'],
+            "embedding": embedding,
+            "chunk_type": metadata['chunk_type'],
+            "meeting_native_id": meeting.platform_specific_id,
+            "platform": meeting.platform,
+            "chunk_hash": compute_chunk_hash(metadata['text'], meeting.id, metadata['chunk_type']),
+            "meeting_date": meeting_date,
+            "timestamp": meeting.start_time,
+        }
+        for metadata, embedding in zip(insight_chunks, embeddings)
+    ]
+    upsert_embedding_rows(session, meeting.id, rows, TranscriptEmbedding.chunk_type != 'transcript')
+
+
+def upsert_embedding_rows(
+    session: Session,
+    meeting_id: int,
+    rows: List[Dict[str, Any]],
+    scope: Any,
+) -> None:
+    """
+    Upsert chunk rows on (meeting_id, chunk_hash), then delete the meeting's rows
+    matching `scope` that are no longer produced. Unchanged rows are left untouched,
+    so a re-run writes nothing and the HNSW index is not churned.
+    """
+    rows = list({row["chunk_hash"]: row for row in rows}.values())
+    if rows:
+        stmt = insert(TranscriptEmbedding)
+        updated = [key for key in rows[0] if key not in ("meeting_id", "chunk_hash")]
+        current = [getattr(TranscriptEmbedding, key) for key in updated]
+        incoming = [stmt.excluded[key] for key in updated]
+        session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[TranscriptEmbedding.meeting_id, TranscriptEmbedding.chunk_hash],
+                set_=dict(zip(updated, incoming)),
+                where=tuple_(*current).is_distinct_from(tuple_(*incoming)),
+            ),
+            rows,
+        )
+
+    session.execute(
+        delete(TranscriptEmbedding)
+        .where(
+            TranscriptEmbedding.meeting_id == meeting_id,
+            scope,
+            or_(
+                TranscriptEmbedding.chunk_hash.is_(None),
+                TranscriptEmbedding.chunk_hash.not_in([row["chunk_hash"] for row in rows]),
+            ),
+        )
+        .execution_options(synchronize_session=False)
+    )
 
 
 def persist_insights(
     session: Session,
     meeting: Meeting,
     insights: Dict[str, Any],
-    segments: List[Transcription],
+    segments: Sequence[Row],
     embeddings: List[List[float]],
 ) -> None:
     session.query(SpeakerHighlight).filter_by(meeting_id=meeting.id).delete()
     session.query(ActionItem).filter_by(meeting_id=meeting.id).delete()
-    session.query(TranscriptEmbedding).filter_by(meeting_id=meeting.id).delete()
 
     metadata_record = meeting.metadata_record or MeetingMetadata(meeting_id=meeting.id)
     overview = insights.get("overview", {})
@@ -428,6 +611,8 @@ def persist_insights(
     if not meeting.metadata_record:
         session.add(metadata_record)
 
+    # Write-only rows: one executemany INSERT per table, no ORM objects or identity map
+    highlight_rows = []
     for speaker_entry in insights.get("speaker_digests", []):
         speaker_name = speaker_entry.get("name")
         for highlight in speaker_entry.get("highlights", []):
@@ -443,19 +628,21 @@ def persist_insights(
                 if meeting.start_time and isinstance(end, (int, float))
                 else None
             )
-            session.add(
-                SpeakerHighlight(
-                    meeting_id=meeting.id,
-                    speaker=speaker_name,
-                    start_time=start,
-                    end_time=end,
-                    absolute_start_time=absolute_start,
-                    absolute_end_time=absolute_end,
-                    text=highlight.get("text"),
-                    label=highlight.get("label"),
-                )
+            highlight_rows.append(
+                {
+                    "meeting_id": meeting.id,
+                    "speaker": speaker_name,
+                    "start_time": start,
+                    "end_time": end,
+                    "absolute_start_time": absolute_start,
+                    "absolute_end_time": absolute_end,
+                    "text": highlight.get("text"),
+                    "label": highlight.get("label"),
+                }
             )
 
+    action_rows = []
+
     def enqueue_action(
         description: str,
         owner: Optional[str],
@@ -464,16 +651,16 @@ def persist_insights(
         priority: Optional[str],
         reference: Optional[str] = None,
     ):
-        session.add(
-            ActionItem(
-                meeting_id=meeting.id,
-                owner=owner,
-                description=description,
-                due_date=parse_iso_datetime(due_date),
-                status=status,
-                priority=priority,
-                reference_url=reference,
-            )
+        action_rows.append(
+            {
+                "meeting_id": meeting.id,
+                "owner": owner,
+                "description": description,
+                "due_date": parse_iso_datetime(due_date),
+                "status": status,
+                "priority": priority,
+                "reference_url": reference,
+            }
         )
 
     for item in insights.get("action_items", []):
@@ -500,44 +687,79 @@ def persist_insights(
                 subtask.get("dependencies"),
             )
 
+    meeting_date = meeting.start_time.date() if meeting.start_time else None
+    embedding_rows = []
     for segment, vector in zip(segments, embeddings):
         absolute_ts = (
             meeting.start_time + timedelta(seconds=segment.start_time)
             if meeting.start_time
             else None
         )
-        meeting_date = meeting.start_time.date() if meeting.start_time else None
-        chunk_hash = compute_chunk_hash(segment.text, meeting.id, 'transcript')
-        
-        session.add(
-            TranscriptEmbedding(
-                meeting_id=meeting.id,
-                segment_start=segment.start_time,
-                segment_end=segment.end_time,
-                speaker=segment.speaker,
-                text=segment.text,
-                timestamp=absolute_ts,
-                embedding=vector,
-                chunk_type='transcript',
-                meeting_native_id=meeting.platform_specific_id,
-                platform=meeting.platform,
-                language=segment.language,
-                chunk_hash=chunk_hash,
-                meeting_date=meeting_date,
-            )
+        embedding_rows.append(
+            {
+                "meeting_id": meeting.id,
+                "segment_start": segment.start_time,
+                "segment_end": segment.end_time,
+                "speaker": segment.speaker,
+                "text": segment.text,
+                "timestamp": absolute_ts,
+                "embedding": vector,
+                "chunk_type": 'transcript',
+                "meeting_native_id": meeting.platform_specific_id,
+                "platform": meeting.platform,
+                "language": segment.language,
+                # The start time keeps repeated lines ("Да.") distinct within a meeting
+                "chunk_hash": compute_chunk_hash(
+                    f"{segment.start_time}:{segment.text}", meeting.id, 'transcript'
+                ),
+                "meeting_date": meeting_date,
+            }
         )
 
+    for model, rows in (
+        (SpeakerHighlight, highlight_rows),
+        (ActionItem, action_rows),
+    ):
+        if rows:
+            session.execute(insert(model), rows)
+
+    upsert_embedding_rows(
+        session, meeting.id, embedding_rows, TranscriptEmbedding.chunk_type == 'transcript'
+    )
+
+
+def trigger_downstream(name: str, url: str, meeting_id: int) -> None:
+    """POST one /trigger; failures are logged and never fail meeting processing."""
+    try:
+        response = trigger_client.post(url, json={"meeting_id": meeting_id})
+        if response.status_code == 200:
+            logger.info("%s triggered for meeting %s", name, meeting_id)
+        else:
+            logger.warning("Failed to trigger %s for meeting %s: %s", name, meeting_id, response.text)
+    except Exception as e:
+        logger.warning("Error triggering %s for meeting %s: %s", name, meeting_id, e)
+
+
+def notify_downstream(meeting_id: int) -> None:
+    """Trigger the email notifier and Jira sync for a processed meeting in parallel."""
+    with ThreadPoolExecutor(max_workers=len(DOWNSTREAM_TRIGGERS)) as pool:
+        for name, url in DOWNSTREAM_TRIGGERS:
+            pool.submit(trigger_downstream, name, url, meeting_id)
+
 
 def process_meeting(session: Session, meeting: Meeting) -> None:
-    segments = (
-        session.execute(
-            select(Transcription)
-            .where(Transcription.meeting_id == meeting.id)
-            .order_by(Transcription.start_time.asc())
+    # Plain column rows (no ORM hydration); attribute access (segment.text) still works
+    segments = session.execute(
+        select(
+            Transcription.speaker,
+            Transcription.start_time,
+            Transcription.end_time,
+            Transcription.text,
+            Transcription.language,
         )
-        .scalars()
-        .all()
-    )
+        .where(Transcription.meeting_id == meeting.id)
+        .order_by(Transcription.start_time.asc())
+    ).all()
 
     if not segments:
         logger.info("Meeting %s has no transcripts; marking as completed", meeting.id)
@@ -549,10 +771,29 @@ def process_meeting(session: Session, meeting: Meeting) -> None:
     transcript_payload = build_transcript_payload(meeting, segments)
     team_context = load_team_context()
     messages = build_insights_prompt(meeting, transcript_payload, team_context)
-    insights = call_summary_model(messages)
-
     texts = [seg.text for seg in segments]
-    embeddings = generate_embeddings(texts)
+
+    # Identical prompt + model (re-runs, retries) reuses the stored summary
+    cache_key = hashlib.sha256(SUMMARY_MODEL.encode("utf-8") + orjson.dumps(messages)).hexdigest()
+    insights = session.execute(
+        select(InsightsCache.insights).where(InsightsCache.key == cache_key)
+    ).scalar_one_or_none()
+
+    if insights is not None:
+        logger.info("Meeting %s: summary served from insights cache", meeting.id)
+        embeddings = embed_texts_cached(session, texts)
+    else:
+        # The summary call and the segment embeddings only depend on the transcript, so
+        # they overlap; the session stays on this thread (embed_texts_cached uses it).
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            insights_future = pool.submit(call_summary_model, messages)
+            embeddings = embed_texts_cached(session, texts)
+            insights = insights_future.result()
+        session.execute(
+            insert(InsightsCache)
+            .values(key=cache_key, model=SUMMARY_MODEL, insights=insights)
+            .on_conflict_do_nothing()
+        )
 
     persist_insights(session, meeting, insights, segments, embeddings)
 
@@ -561,9 +802,15 @@ def process_meeting(session: Session, meeting: Meeting) -> None:
     if team_context:
         meeting.data["team_roster_snapshot"] = team_context
 
-    # Embed structured insights content
+    # Embed structured insights content. They need the summary, so they get their
+    # own (small) embedding pass after it: the segment pass above overlaps the
+    # summary call instead of waiting for it. A failure here must not fail the
+    # whole meeting, so it runs in a savepoint that a DB error rolls back alone.
     try:
-        embed_structured_insights(session, meeting, insights, client)
+        with session.begin_nested():
+            insight_chunks = build_structured_insight_chunks(insights)
+            insight_embeddings = embed_texts_cached(session, [chunk["text"] for chunk in insight_chunks])
+            embed_structured_insights(session, meeting, insight_chunks, insight_embeddings)
     except Exception as e:
         logger.warning("Failed to embed structured insights for meeting %s: %s", meeting.id, e)
 
@@ -571,69 +818,98 @@ def process_meeting(session: Session, meeting: Meeting) -> None:
     meeting.processed_at = datetime.utcnow()
     session.commit()
     logger.info("Meeting %s processed successfully", meeting.id)
-    
-    # Trigger email notification for this meeting
-    try:
-        email_notifier_url = os.environ.get("EMAIL_NOTIFIER_URL", "http://email-notifier:8003")
-        trigger_url = f"{email_notifier_url}/trigger"
-        
-        response = httpx.post(
-            trigger_url,
-            json={"meeting_id": meeting.id},
-            timeout=5.0
-        )
-        if response.status_code == 200:
-            logger.info("Email notification triggered for meeting %s", meeting.id)
-        else:
-            logger.warning("Failed to trigger email notification for meeting %s: %s", meeting.id, response.text)
-    except Exception as e:
-        # Don't fail meeting processing if email trigger fails
-        logger.warning("Error triggering email notification for meeting %s: %s", meeting.id, e)
-    
-    # Trigger Jira sync for this meeting
-    try:
-        jira_sync_url = os.environ.get("JIRA_SYNC_URL", "http://jira-sync-worker:8004")
-        trigger_url = f"{jira_sync_url}/trigger"
-        
-        response = httpx.post(
-            trigger_url,
-            json={"meeting_id": meeting.id},
-            timeout=5.0
-        )
-        if response.status_code == 200:
-            logger.info("Jira sync triggered for meeting %s", meeting.id)
-        else:
-            logger.warning("Failed to trigger Jira sync for meeting %s: %s", meeting.id, response.text)
-    except Exception as e:
-        # Don't fail meeting processing if Jira sync trigger fails
-        logger.warning("Error triggering Jira sync for meeting %s: %s", meeting.id, e)
+
+    # Downstream triggers are independent; send them concurrently
+    notify_downstream(meeting.id)
+
+
+def process_claimed_meeting(meeting_id: int) -> bool:
+    """Process one claimed meeting in its own session (safe to run concurrently)."""
+    with SessionLocal() as session:
+        meeting = load_claimed_meeting(session, meeting_id)
+        try:
+            process_meeting(session, meeting)
+            return True
+        except Exception:
+            logger.exception("Failed to process meeting %s", meeting_id)
+            session.rollback()
+            meeting.summary_state = "error"
+            session.commit()
+            return False
 
 
 def process_batch() -> bool:
-    processed_any = False
     with SessionLocal() as session:
-        for _ in range(BATCH_SIZE):
-            meeting = select_next_meeting(session)
-            if not meeting:
-                break
-            try:
-                process_meeting(session, meeting)
-                processed_any = True
-            except Exception as exc:
-                logger.exception("Failed to process meeting %s", meeting.id)
-                meeting.summary_state = "error"
-                session.commit()
-    return processed_any
+        meeting_ids = claim_meetings(session, BATCH_SIZE)
+    if not meeting_ids:
+        return False
+    if len(meeting_ids) == 1:
+        return process_claimed_meeting(meeting_ids[0])
+    with ThreadPoolExecutor(max_workers=len(meeting_ids)) as pool:
+        return any(list(pool.map(process_claimed_meeting, meeting_ids)))
+
+
+def open_notification_listener():
+    """
+    Open a dedicated connection that LISTENs on NOTIFY_CHANNEL.
+    Returns None if it cannot be opened; the worker then falls back to polling.
+    """
+    try:
+        connection = sync_engine.raw_connection()
+        # Held for the worker's lifetime, never handed back to the pool
+        connection.detach()
+        dbapi_connection = connection.driver_connection
+        dbapi_connection.autocommit = True
+        with dbapi_connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {NOTIFY_CHANNEL};")
+        logger.info("Listening for notifications on channel '%s'", NOTIFY_CHANNEL)
+        return connection
+    except Exception as e:
+        logger.warning("Could not LISTEN on '%s', polling only: %s", NOTIFY_CHANNEL, e)
+        return None
+
+
+def wait_for_notification(listener, timeout: float):
+    """
+    Block until a NOTIFY arrives or timeout elapses, draining pending notifications.
+    Returns the listener to keep using, or None if the connection broke.
+    """
+    if listener is None:
+        time.sleep(timeout)
+        return None
+
+    dbapi_connection = listener.driver_connection
+    try:
+        ready, _, _ = select_module.select([dbapi_connection], [], [], timeout)
+        if ready:
+            dbapi_connection.poll()
+            notified = [n.payload for n in dbapi_connection.notifies]
+            dbapi_connection.notifies.clear()
+            logger.debug("Woken up by notifications for meetings: %s", notified)
+        return listener
+    except Exception as e:
+        logger.warning("Notification listener failed, reconnecting: %s", e)
+        try:
+            listener.close()
+        except Exception:
+            pass
+        return None
 
 
 def main():
     logger.info("Starting meeting insights worker (summary model: %s)", SUMMARY_MODEL)
+    # NOTIFY wakes the loop up early; POLL_INTERVAL stays as the polling floor
+    # in case a notification is missed (e.g. while the listener reconnects).
+    listener = open_notification_listener()
     while True:
         had_work = process_batch()
-        sleep_for = 2 if had_work else POLL_INTERVAL
-        time.sleep(sleep_for)
+        if had_work:
+            time.sleep(2)
+            continue
+        if listener is None:
+            listener = open_notification_listener()
+        listener = wait_for_notification(listener, POLL_INTERVAL)
 
 
 if __name__ == "__main__":
     main()
-
@@ -1,16 +1,25 @@
 """
 RAG API endpoints for querying meeting transcripts using semantic search.
 """
-import json
+import asyncio
+import hashlib
 import logging
 import os
-from typing import List, Optional, Dict, Any
+import time
+from array import array
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import List, Optional, Dict, Any, Set, Tuple
 
 from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
-from openai import OpenAI
-from sqlalchemy.orm import Session, sessionmaker
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, field_validator
+import httpx
+import orjson
+from openai import APIStatusError, AsyncOpenAI, BadRequestError, DefaultAsyncHttpxClient
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
 
 from shared_models.database import sync_engine
 from shared_models.models import Meeting
@@ -34,10 +43,56 @@ EMBEDDING_MODEL = os.environ.get("OPENAI_EMBEDDING_MODEL", "text-embedding-3-sma
 RAG_TOP_K = int(os.environ.get("RAG_TOP_K", "8"))
 ASK_MEETING_TOP_K = int(os.environ.get("ASK_MEETING_TOP_K", "6"))
 RAG_MAX_HISTORY = int(os.environ.get("RAG_MAX_HISTORY", "10"))
+# Newest history messages kept verbatim; older ones become one-line excerpts
+RAG_HISTORY_VERBATIM = int(os.environ.get("RAG_HISTORY_VERBATIM", "3"))
+HISTORY_EXCERPT_CHARS = 120
+# Estimated tokens of retrieved chunk text put into the prompt (len // 4 per chunk)
+RAG_CONTEXT_TOKEN_BUDGET = int(os.environ.get("RAG_CONTEXT_TOKEN_BUDGET", "6000"))
+RAG_HNSW_EF_SEARCH = int(os.environ.get("RAG_HNSW_EF_SEARCH", "40"))
+QUERY_EMBEDDING_CACHE_SIZE = int(os.environ.get("RAG_QUERY_EMBEDDING_CACHE_SIZE", "2048"))
+QUERY_EMBEDDING_TTL = int(os.environ.get("RAG_QUERY_EMBEDDING_TTL", "3600"))
+# Concurrent query embeddings are coalesced into one request: up to this many
+# inputs, collected for at most this long after the first one arrives
+EMBED_BATCH_SIZE = int(os.environ.get("RAG_EMBED_BATCH_SIZE", "64"))
+EMBED_BATCH_WAIT_MS = int(os.environ.get("RAG_EMBED_BATCH_WAIT_MS", "5"))
+# Meeting rows + structured insights reused across follow-up questions. The
+# insights worker runs in another process and can't invalidate this, so keep it short.
+MEETING_CONTEXT_TTL = int(os.environ.get("RAG_MEETING_CONTEXT_TTL", "60"))
+MEETING_CONTEXT_CACHE_SIZE = 1024
+
+# One keep-alive HTTP/2 connection pool for every embedding and chat call.
+# Async, so in-flight OpenAI calls don't block the event loop; database work
+# (sync SQLAlchemy) runs in worker threads via asyncio.to_thread.
+openai_client = AsyncOpenAI(
+    api_key=OPENAI_API_KEY,
+    http_client=DefaultAsyncHttpxClient(
+        http2=True,
+        timeout=httpx.Timeout(60.0, connect=5.0),
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+    ),
+)
 
-openai_client = OpenAI(api_key=OPENAI_API_KEY)
-
-app = FastAPI(title="Meeting Insights RAG API", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The embedding batcher and the OpenAI probe are defined further down; both
+    # are stopped before the clients they use are closed
+    embedding_batcher.start()
+    start_openai_probe()
+    try:
+        yield
+    finally:
+        await embedding_batcher.stop()
+        await stop_openai_probe()
+        await openai_client.close()
+        sync_engine.dispose()
+
+
+app = FastAPI(
+    title="Meeting Insights RAG API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -54,12 +109,26 @@ class ConversationMessage(BaseModel):
 
 
 class RAGQueryRequest(BaseModel):
-    query: str = Field(..., description="User query/question")
+    query: str = Field(..., min_length=1, max_length=4096, description="User query/question")
     mode: str = Field(..., description="Mode: 'global' or 'meeting'")
     meeting_id: Optional[int] = Field(None, description="Meeting ID (required for 'meeting' mode)")
-    conversation: List[ConversationMessage] = Field(default_factory=list, description="Conversation history")
+    conversation: List[ConversationMessage] = Field(default_factory=list, max_length=100, description="Conversation history")
     filters: Optional[Dict[str, Any]] = Field(None, description="Additional filters (speaker, language, date range, etc.)")
 
+    @field_validator("query")
+    @classmethod
+    def strip_query(cls, query: str) -> str:
+        query = query.strip()
+        if not query:
+            raise ValueError("query must not be blank")
+        return query
+
+    @field_validator("conversation")
+    @classmethod
+    def keep_recent_history(cls, conversation: List[ConversationMessage]) -> List[ConversationMessage]:
+        # Only the last RAG_MAX_HISTORY messages reach the prompt
+        return conversation[-RAG_MAX_HISTORY:] if RAG_MAX_HISTORY else []
+
 
 class ChunkResponse(BaseModel):
     id: int
@@ -81,6 +150,42 @@ class RAGQueryResponse(BaseModel):
     token_usage: Optional[Dict[str, int]] = Field(None, description="Token usage statistics")
 
 
+def dumps_context(value: Any) -> str:
+    """Compact JSON for prompt context: indentation only costs tokens, the model doesn't need it."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def fit_chunks_to_budget(chunks: List[Chunk]) -> List[Chunk]:
+    """Most similar chunks first, stopping before RAG_CONTEXT_TOKEN_BUDGET is exceeded (at least one kept)."""
+    fitted = []
+    tokens = 0
+    for chunk in chunks:
+        tokens += len(chunk.text) // 4 + 1
+        if fitted and tokens > RAG_CONTEXT_TOKEN_BUDGET:
+            break
+        fitted.append(chunk)
+    return fitted
+
+
+def build_history_summary(conversation_history: List[ConversationMessage]) -> str:
+    """
+    Last RAG_MAX_HISTORY messages as prompt text; all but the newest
+    RAG_HISTORY_VERBATIM are collapsed to a single line of HISTORY_EXCERPT_CHARS.
+    """
+    recent_messages = conversation_history[-RAG_MAX_HISTORY:]
+    excerpt_count = len(recent_messages) - RAG_HISTORY_VERBATIM
+    history_parts = []
+    for index, msg in enumerate(recent_messages):
+        role_label = "Пользователь" if msg.role == "user" else "Ассистент"
+        content = msg.content
+        if index < excerpt_count:
+            content = " ".join(content.split())
+            if len(content) > HISTORY_EXCERPT_CHARS:
+                content = content[:HISTORY_EXCERPT_CHARS].rstrip() + "…"
+        history_parts.append(f"{role_label}: {content}")
+    return "\n".join(history_parts)
+
+
 def build_global_rag_prompt(
     query: str,
     chunks: List[Chunk],
@@ -103,24 +208,16 @@ def build_global_rag_prompt(
     context_items = []
     for chunk in chunks:
         meeting_info = chunk.meeting_native_id or f"Meeting #{chunk.meeting_id}"
-        timestamp_str = chunk.timestamp.isoformat() if chunk.timestamp else "n/a"
         context_items.append({
             "meeting": meeting_info,
             "platform": chunk.platform or "unknown",
             "speaker": chunk.speaker or "Unknown",
-            "timestamp": timestamp_str,
+            "timestamp": chunk.timestamp_iso or "n/a",
             "text": chunk.text,
         })
     
     # Build conversation history summary
-    history_summary = ""
-    if conversation_history:
-        recent_messages = conversation_history[-RAG_MAX_HISTORY:]
-        history_parts = []
-        for msg in recent_messages:
-            role_label = "Пользователь" if msg.role == "user" else "Ассистент"
-            history_parts.append(f"{role_label}: {msg.content}")
-        history_summary = "\n".join(history_parts)
+    history_summary = build_history_summary(conversation_history)
     
     user_prompt = f"""
 {history_summary}
@@ -128,7 +225,7 @@ def build_global_rag_prompt(
 Вопрос пользователя: {query}
 
 Контекст (JSON массив объектов):
-{json.dumps(context_items, ensure_ascii=False, indent=2)}
+{dumps_context(context_items)}
 
 ПРИМЕЧАНИЕ: Некоторые фразы в контексте могут быть галлюцинациями (ошибками распознавания речи). 
 Используй только релевантный контекст, который логично связан с вопросом. Игнорируй бессмысленные или нерелевантные фразы.
@@ -170,27 +267,19 @@ def build_meeting_rag_prompt(
             logger.warning(f"Chunk {chunk.id} belongs to different meeting, skipping")
             continue
         
-        timestamp_str = chunk.timestamp.isoformat() if chunk.timestamp else "n/a"
         context_items.append({
             "speaker": chunk.speaker or "Unknown",
-            "timestamp": timestamp_str,
+            "timestamp": chunk.timestamp_iso or "n/a",
             "text": chunk.text,
         })
     
     # Add insights context if available
     insights_section = ""
     if insights_context:
-        insights_section = f"\n\nСтруктурированные инсайты встречи:\n{json.dumps(insights_context, ensure_ascii=False, indent=2)}"
+        insights_section = f"\n\nСтруктурированные инсайты встречи:\n{dumps_context(insights_context)}"
     
     # Build conversation history summary
-    history_summary = ""
-    if conversation_history:
-        recent_messages = conversation_history[-RAG_MAX_HISTORY:]
-        history_parts = []
-        for msg in recent_messages:
-            role_label = "Пользователь" if msg.role == "user" else "Ассистент"
-            history_parts.append(f"{role_label}: {msg.content}")
-        history_summary = "\n".join(history_parts)
+    history_summary = build_history_summary(conversation_history)
     
     user_prompt = f"""
 {history_summary}
@@ -198,7 +287,7 @@ def build_meeting_rag_prompt(
 Вопрос пользователя: {query}
 
 Контекст из транскрипта (JSON массив объектов):
-{json.dumps(context_items, ensure_ascii=False, indent=2)}
+{dumps_context(context_items)}
 {insights_section}
 
 ПРИМЕЧАНИЕ: Некоторые фразы в контексте могут быть галлюцинациями (ошибками распознавания речи). 
@@ -211,25 +300,235 @@ def build_meeting_rag_prompt(
     ]
 
 
+class EmbeddingBatcher:
+    """Micro-batches embed requests from concurrent handlers into single embeddings.create calls."""
+
+    def __init__(self, max_batch: int, max_wait: float):
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: Optional["asyncio.Queue[Tuple[str, asyncio.Future]]"] = None
+        self._runner: Optional["asyncio.Task[None]"] = None
+        # Strong references, so in-flight batch tasks are not garbage collected
+        self._pending: Set["asyncio.Task[None]"] = set()
+
+    def start(self) -> None:
+        self._queue = asyncio.Queue()
+        self._runner = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._runner:
+            self._runner.cancel()
+            await asyncio.gather(self._runner, return_exceptions=True)
+
+    async def submit(self, text: str) -> List[float]:
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            # Next window opens while this batch is in flight
+            task = asyncio.create_task(self._embed(batch))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+    async def _embed(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        try:
+            embedding_response = await openai_client.embeddings.create(
+                model=EMBEDDING_MODEL,
+                input=[text for text, _ in batch]
+            )
+        except BadRequestError as e:
+            if len(batch) == 1:
+                self._fail(batch, e)
+                return
+            # One rejected input fails the whole request; embed each on its own
+            # so only the offending query's caller gets the error
+            logger.warning(f"Embedding batch of {len(batch)} rejected, retrying individually: {e}")
+            await asyncio.gather(*(self._embed([item]) for item in batch))
+            return
+        except Exception as e:
+            self._fail(batch, e)
+            return
+        for item in embedding_response.data:
+            future = batch[item.index][1]
+            if not future.done():
+                future.set_result(item.embedding)
+
+    @staticmethod
+    def _fail(batch: List[Tuple[str, asyncio.Future]], error: Exception) -> None:
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+
+embedding_batcher = EmbeddingBatcher(EMBED_BATCH_SIZE, EMBED_BATCH_WAIT_MS / 1000)
+
+
+# sha256(model|normalized query) -> (expires_at, float32 vector), least recently used
+# evicted first (a float32 array is ~4x smaller than a list of floats). Only touched
+# from the event loop thread, so no locking is needed.
+_query_embeddings: "OrderedDict[bytes, Tuple[float, array]]" = OrderedDict()
+# Embedding calls in flight, so identical concurrent queries share one request
+_query_embeddings_inflight: Dict[bytes, "asyncio.Task[array]"] = {}
+
+
+async def _fetch_query_embedding(key: bytes, query: str) -> array:
+    try:
+        vector = array("f", await embedding_batcher.submit(query))
+        _query_embeddings[key] = (time.monotonic() + QUERY_EMBEDDING_TTL, vector)
+        if len(_query_embeddings) > QUERY_EMBEDDING_CACHE_SIZE:
+            _query_embeddings.popitem(last=False)
+        return vector
+    finally:
+        _query_embeddings_inflight.pop(key, None)
+
+
+async def embed_query(query: str) -> List[float]:
+    """
+    Embedding of a query string; repeated questions skip the OpenAI call.
+    Only the cache key is normalized (stripped, lowercased); the stripped query
+    itself is what gets embedded, so abbreviations and ticket keys keep their casing.
+    """
+    query = query.strip()
+    key = hashlib.sha256(f"{EMBEDDING_MODEL}|{query.lower()}".encode("utf-8")).digest()
+    entry = _query_embeddings.get(key)
+    if entry is not None:
+        expires_at, vector = entry
+        if expires_at > time.monotonic():
+            _query_embeddings.move_to_end(key)
+            return vector.tolist()
+        del _query_embeddings[key]
+
+    task = _query_embeddings_inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_fetch_query_embedding(key, query))
+        _query_embeddings_inflight[key] = task
+    # Shielded: a disconnecting client must not cancel the call other requests await
+    vector = await asyncio.shield(task)
+    return vector.tolist()
+
+
+def ping_database() -> None:
+    # Plain pooled connection: no Session or transaction bookkeeping for a SELECT 1
+    with sync_engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+def retrieve_chunks(
+    query_embedding: List[float],
+    limit: int,
+    filters: Dict[str, Any],
+) -> List[Chunk]:
+    with SessionLocal() as session:
+        return fetch_chunks(
+            session=session,
+            query_embedding=query_embedding,
+            limit=limit,
+            filters=filters,
+            ef_search=RAG_HNSW_EF_SEARCH,
+        )
+
+
+def load_meeting_context(meeting_id: int) -> Tuple[Optional[Meeting], Optional[Dict[str, Any]]]:
+    """Meeting row and its structured insights; the meeting stays usable after the session closes."""
+    with SessionLocal() as session:
+        meeting = session.get(Meeting, meeting_id)
+        if not meeting:
+            return None, None
+        return meeting, get_meeting_insights_context(session, meeting_id)
+
+
+# meeting_id -> (expires_at, meeting, insights_context); event loop thread only
+_meeting_contexts: "OrderedDict[int, Tuple[float, Meeting, Optional[Dict[str, Any]]]]" = OrderedDict()
+
+
+async def get_meeting_context(meeting_id: int) -> Tuple[Optional[Meeting], Optional[Dict[str, Any]]]:
+    """load_meeting_context behind a per-meeting TTL cache (unknown meetings are not cached)."""
+    entry = _meeting_contexts.get(meeting_id)
+    if entry is not None:
+        expires_at, meeting, insights_context = entry
+        if expires_at > time.monotonic():
+            _meeting_contexts.move_to_end(meeting_id)
+            return meeting, insights_context
+        del _meeting_contexts[meeting_id]
+
+    meeting, insights_context = await asyncio.to_thread(load_meeting_context, meeting_id)
+    if meeting is not None:
+        _meeting_contexts[meeting_id] = (time.monotonic() + MEETING_CONTEXT_TTL, meeting, insights_context)
+        if len(_meeting_contexts) > MEETING_CONTEXT_CACHE_SIZE:
+            _meeting_contexts.popitem(last=False)
+    return meeting, insights_context
+
+
+# OpenAI reachability is probed in the background, not per health request
+OPENAI_PROBE_INTERVAL = 60
+OPENAI_PROBE_MAX_AGE = 300
+_openai_health: Dict[str, Any] = {"last_ok": time.monotonic(), "error": None}
+
+
+async def probe_openai() -> None:
+    while True:
+        try:
+            try:
+                # Free call; the first page is enough, nothing is iterated
+                await openai_client.models.list()
+            except APIStatusError:
+                # OpenAI answered but refused /models (e.g. a restricted key);
+                # check the endpoint we depend on instead
+                await openai_client.embeddings.create(
+                    model=EMBEDDING_MODEL,
+                    input=["test"]
+                )
+            _openai_health["last_ok"] = time.monotonic()
+            _openai_health["error"] = None
+        except Exception as e:
+            logger.warning(f"OpenAI probe failed: {e}")
+            _openai_health["error"] = str(e)
+        await asyncio.sleep(OPENAI_PROBE_INTERVAL)
+
+
+_openai_probe: Optional["asyncio.Task[None]"] = None
+
+
+def start_openai_probe() -> None:
+    global _openai_probe
+    _openai_probe = asyncio.create_task(probe_openai())
+
+
+async def stop_openai_probe() -> None:
+    if _openai_probe:
+        _openai_probe.cancel()
+        await asyncio.gather(_openai_probe, return_exceptions=True)
+
+
 @app.get("/rag/health")
 async def health_check():
-    """Health check endpoint."""
+    """
+    Health check endpoint.
+
+    Only the database is queried here; OpenAI reachability comes from a
+    background probe (every OPENAI_PROBE_INTERVAL seconds), and the check fails
+    once the last successful probe is older than OPENAI_PROBE_MAX_AGE.
+    """
     try:
-        with SessionLocal() as session:
-            # Test database connection
-            from sqlalchemy import text
-            session.execute(text("SELECT 1"))
-            session.commit()
+        # Test database connection
+        await asyncio.to_thread(ping_database)
         
-        # Test OpenAI connection (lightweight check)
-        try:
-            openai_client.models.list(limit=1)
-        except Exception:
-            # If models.list fails, try a simple embedding call instead
-            openai_client.embeddings.create(
-                model=EMBEDDING_MODEL,
-                input=["test"]
-            )
+        # OpenAI status from the background probe
+        if time.monotonic() - _openai_health["last_ok"] > OPENAI_PROBE_MAX_AGE:
+            raise RuntimeError(f"OpenAI unreachable: {_openai_health['error']}")
         
         return {"status": "healthy", "model": RAG_LLM_MODEL, "embedding_model": EMBEDDING_MODEL}
     except Exception as e:
@@ -237,6 +536,112 @@ async def health_check():
         raise HTTPException(status_code=503, detail=f"Service unhealthy: {str(e)}")
 
 
+NO_CHUNKS_ANSWER = "Не найдено релевантных данных в транскриптах встреч."
+
+
+async def prepare_rag_query(
+    request: RAGQueryRequest,
+) -> Tuple[List[Chunk], Optional[List[Dict[str, str]]]]:
+    """
+    Validate the request, retrieve chunks and build the LLM prompt.
+    Messages are None when nothing relevant was found.
+    """
+    # Validate mode
+    if request.mode not in ['global', 'meeting']:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Mode must be 'global' or 'meeting'"
+        )
+    
+    if request.mode == 'meeting' and not request.meeting_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="meeting_id is required for 'meeting' mode"
+        )
+    
+    # Build filters
+    filters = request.filters or {}
+    if request.mode == 'meeting':
+        filters['meeting_id'] = request.meeting_id
+    
+    # Determine limit
+    limit = ASK_MEETING_TOP_K if request.mode == 'meeting' else RAG_TOP_K
+    
+    # Generate query embedding; in meeting mode the meeting and its insights
+    # are loaded at the same time, since they don't depend on the embedding
+    meeting = None
+    insights_context = None
+    if request.mode == 'meeting':
+        query_embedding, (meeting, insights_context) = await asyncio.gather(
+            embed_query(request.query),
+            get_meeting_context(request.meeting_id),
+        )
+    else:
+        query_embedding = await embed_query(request.query)
+    
+    # Retrieve chunks (ordered by similarity); the citations returned are the ones in the prompt
+    chunks = fit_chunks_to_budget(
+        await asyncio.to_thread(retrieve_chunks, query_embedding, limit, filters)
+    )
+    
+    if not chunks:
+        return chunks, None
+    
+    if request.mode == 'meeting' and not meeting:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Meeting {request.meeting_id} not found"
+        )
+    
+    # Build prompt
+    if request.mode == 'meeting' and meeting:
+        messages = build_meeting_rag_prompt(
+            query=request.query,
+            meeting=meeting,
+            chunks=chunks,
+            insights_context=insights_context,
+            conversation_history=request.conversation,
+        )
+    else:
+        messages = build_global_rag_prompt(
+            query=request.query,
+            chunks=chunks,
+            conversation_history=request.conversation,
+        )
+    return chunks, messages
+
+
+def chunk_payload(chunk: Chunk) -> Dict[str, Any]:
+    """ChunkResponse-shaped dict, serialized by orjson without a Pydantic round trip."""
+    return {
+        "id": chunk.id,
+        "meeting_id": chunk.meeting_id,
+        "meeting_native_id": chunk.meeting_native_id,
+        "platform": chunk.platform,
+        "speaker": chunk.speaker,
+        "text": chunk.text,
+        "start_time": chunk.start_time,
+        "end_time": chunk.end_time,
+        "timestamp": chunk.timestamp_iso,
+        "chunk_type": chunk.chunk_type,
+        "similarity_score": chunk.similarity_score,
+    }
+
+
+def extract_token_usage(usage: Any) -> Optional[Dict[str, int]]:
+    if usage is None:
+        return None
+    return {
+        'prompt_tokens': getattr(usage, 'prompt_tokens', 0),
+        'completion_tokens': getattr(usage, 'completion_tokens', 0),
+        'total_tokens': getattr(usage, 'total_tokens', 0),
+    }
+
+
+def sse_event(payload: Dict[str, Any]) -> bytes:
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
 @app.post("/rag/query", response_model=RAGQueryResponse)
 async def rag_query(request: RAGQueryRequest):
     """
@@ -247,142 +652,57 @@ async def rag_query(request: RAGQueryRequest):
     - 'meeting': Search within a specific meeting (requires meeting_id)
     """
     try:
-        # Validate mode
-        if request.mode not in ['global', 'meeting']:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Mode must be 'global' or 'meeting'"
-            )
+        chunks, messages = await prepare_rag_query(request)
         
-        if request.mode == 'meeting' and not request.meeting_id:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="meeting_id is required for 'meeting' mode"
-            )
-        
-        # Generate query embedding
-        embedding_response = openai_client.embeddings.create(
-            model=EMBEDDING_MODEL,
-            input=[request.query]
-        )
-        query_embedding = embedding_response.data[0].embedding
+        if not messages:
+            return ORJSONResponse({
+                "answer": NO_CHUNKS_ANSWER,
+                "chunks": [],
+                "token_usage": None,
+            })
         
-        # Build filters
-        filters = request.filters or {}
-        if request.mode == 'meeting':
-            filters['meeting_id'] = request.meeting_id
-        
-        # Determine limit
-        limit = ASK_MEETING_TOP_K if request.mode == 'meeting' else RAG_TOP_K
-        
-        # Retrieve chunks
-        with SessionLocal() as session:
-            chunks = fetch_chunks(
-                session=session,
-                query_embedding=query_embedding,
-                limit=limit,
-                filters=filters,
+        # Call LLM
+        try:
+            response = await openai_client.responses.create(
+                model=RAG_LLM_MODEL,
+                input=messages
             )
             
-            if not chunks:
-                return RAGQueryResponse(
-                    answer="Не найдено релевантных данных в транскриптах встреч.",
-                    chunks=[],
-                    token_usage=None,
-                )
-            
-            # Get meeting info for meeting mode
-            meeting = None
-            insights_context = None
-            if request.mode == 'meeting' and request.meeting_id:
-                meeting = session.get(Meeting, request.meeting_id)
-                if not meeting:
-                    raise HTTPException(
-                        status_code=status.HTTP_404_NOT_FOUND,
-                        detail=f"Meeting {request.meeting_id} not found"
-                    )
-                insights_context = get_meeting_insights_context(session, request.meeting_id)
+            # Extract answer text
+            answer_text = getattr(response, "output_text", None)
+            if not answer_text:
+                chunks_list = []
+                for block in getattr(response, "output", []) or []:
+                    for content in getattr(block, "content", []) or []:
+                        text_obj = getattr(content, "text", None)
+                        if isinstance(text_obj, dict):
+                            value = text_obj.get("value")
+                        else:
+                            value = getattr(text_obj, "value", None) or text_obj
+                        if value:
+                            chunks_list.append(value)
+                answer_text = "".join(chunks_list).strip()
             
-            # Build prompt
-            if request.mode == 'meeting' and meeting:
-                messages = build_meeting_rag_prompt(
-                    query=request.query,
-                    meeting=meeting,
-                    chunks=chunks,
-                    insights_context=insights_context,
-                    conversation_history=request.conversation,
-                )
-            else:
-                messages = build_global_rag_prompt(
-                    query=request.query,
-                    chunks=chunks,
-                    conversation_history=request.conversation,
-                )
+            if not answer_text:
+                raise RuntimeError(f"Unexpected response format: {response}")
             
-            # Call LLM
-            try:
-                response = openai_client.responses.create(
-                    model=RAG_LLM_MODEL,
-                    input=messages
-                )
-                
-                # Extract answer text
-                answer_text = getattr(response, "output_text", None)
-                if not answer_text:
-                    chunks_list = []
-                    for block in getattr(response, "output", []) or []:
-                        for content in getattr(block, "content", []) or []:
-                            text_obj = getattr(content, "text", None)
-                            if isinstance(text_obj, dict):
-                                value = text_obj.get("value")
-                            else:
-                                value = getattr(text_obj, "value", None) or text_obj
-                            if value:
-                                chunks_list.append(value)
-                    answer_text = "".join(chunks_list).strip()
-                
-                if not answer_text:
-                    raise RuntimeError(f"Unexpected response format: {response}")
-                
-                # Extract token usage if available
-                token_usage = None
-                if hasattr(response, 'usage'):
-                    token_usage = {
-                        'prompt_tokens': getattr(response.usage, 'prompt_tokens', 0),
-                        'completion_tokens': getattr(response.usage, 'completion_tokens', 0),
-                        'total_tokens': getattr(response.usage, 'total_tokens', 0),
-                    }
-                
-            except Exception as e:
-                logger.error(f"LLM call failed: {e}", exc_info=True)
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Failed to generate answer: {str(e)}"
-                )
+            # Extract token usage if available
+            token_usage = extract_token_usage(getattr(response, 'usage', None))
             
-            # Convert chunks to response format
-            chunk_responses = [
-                ChunkResponse(
-                    id=chunk.id,
-                    meeting_id=chunk.meeting_id,
-                    meeting_native_id=chunk.meeting_native_id,
-                    platform=chunk.platform,
-                    speaker=chunk.speaker,
-                    text=chunk.text,
-                    start_time=chunk.start_time,
-                    end_time=chunk.end_time,
-                    timestamp=chunk.timestamp.isoformat() if chunk.timestamp else None,
-                    chunk_type=chunk.chunk_type,
-                    similarity_score=chunk.similarity_score,
-                )
-                for chunk in chunks
-            ]
-            
-            return RAGQueryResponse(
-                answer=answer_text,
-                chunks=chunk_responses,
-                token_usage=token_usage,
+        except Exception as e:
+            logger.error(f"LLM call failed: {e}", exc_info=True)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to generate answer: {str(e)}"
             )
+        
+        # Returned as a Response, so FastAPI skips re-validating against RAGQueryResponse
+        # (still the documented schema)
+        return ORJSONResponse({
+            "answer": answer_text,
+            "chunks": [chunk_payload(chunk) for chunk in chunks],
+            "token_usage": token_usage,
+        })
     
     except HTTPException:
         raise
@@ -394,6 +714,55 @@ async def rag_query(request: RAGQueryRequest):
         )
 
 
+@app.post("/rag/query/stream")
+async def rag_query_stream(request: RAGQueryRequest):
+    """
+    Same as /rag/query, streamed as server-sent events:
+    a "chunks" event with the retrieved context, "delta" events with answer text
+    as it is generated, then "done" with token usage ("error" if generation fails).
+    """
+    try:
+        chunks, messages = await prepare_rag_query(request)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"RAG query failed: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Internal server error: {str(e)}"
+        )
+
+    async def events():
+        yield sse_event({
+            "type": "chunks",
+            "chunks": [chunk_payload(chunk) for chunk in chunks],
+        })
+        if not messages:
+            yield sse_event({"type": "delta", "text": NO_CHUNKS_ANSWER})
+            yield sse_event({"type": "done", "token_usage": None})
+            return
+
+        token_usage = None
+        try:
+            stream = await openai_client.responses.create(
+                model=RAG_LLM_MODEL,
+                input=messages,
+                stream=True,
+            )
+            async for event in stream:
+                if event.type == "response.output_text.delta":
+                    yield sse_event({"type": "delta", "text": event.delta})
+                elif event.type == "response.completed":
+                    token_usage = extract_token_usage(getattr(event.response, 'usage', None))
+        except Exception as e:
+            logger.error(f"LLM stream failed: {e}", exc_info=True)
+            yield sse_event({"type": "error", "detail": f"Failed to generate answer: {str(e)}"})
+            return
+        yield sse_event({"type": "done", "token_usage": token_usage})
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 if __name__ == "__main__":
     import uvicorn
     port = int(os.environ.get("RAG_API_PORT", "8002"))
@@ -1,32 +1,69 @@
 """
 Entry point that runs both the worker loop and the RAG API server.
+
+Each runs in its own child process. If either one exits, the other is stopped
+and this process exits with its code, so the container restart policy brings
+both back instead of leaving a half-running service.
 """
-import asyncio
+import logging
 import multiprocessing
 import os
+import signal
 import sys
+from multiprocessing.connection import wait
+
 import uvicorn
 
-from main import main as worker_main
-from rag_api import app as rag_app
+logging.basicConfig(
+    level=os.environ.get("LOG_LEVEL", "INFO").upper(),
+    format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
+)
+logger = logging.getLogger("insights_runner")
 
 
 def run_worker():
     """Run the worker loop."""
+    from main import main as worker_main
+
     worker_main()
 
 
 def run_api():
     """Run the RAG API server."""
     port = int(os.environ.get("RAG_API_PORT", "8002"))
-    uvicorn.run(rag_app, host="0.0.0.0", port=port, log_level="info")
+    # Each worker process imports rag_api itself, so it gets its own OpenAI
+    # client, DB pool and query-embedding cache
+    workers = int(os.environ.get("RAG_API_WORKERS", "4"))
+    uvicorn.run("rag_api:app", host="0.0.0.0", port=port, workers=workers, log_level="info")
+
+
+def stop(processes):
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+    for process in processes:
+        process.join(timeout=10)
+        if process.is_alive():
+            process.kill()
 
 
 if __name__ == "__main__":
-    # Run worker in a separate process
-    worker_process = multiprocessing.Process(target=run_worker, daemon=True)
-    worker_process.start()
-    
-    # Run API in main process
-    run_api()
+    # Not daemonic: the API process forks its own uvicorn workers
+    processes = [
+        multiprocessing.Process(target=run_worker, name="insights-worker"),
+        multiprocessing.Process(target=run_api, name="rag-api"),
+    ]
+    for process in processes:
+        process.start()
+
+    def handle_sigterm(signum, frame):
+        stop(processes)
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, handle_sigterm)
 
+    wait([process.sentinel for process in processes])
+    exited = next(process for process in processes if not process.is_alive())
+    logger.error("%s exited with code %s; stopping", exited.name, exited.exitcode)
+    stop(processes)
+    sys.exit(exited.exitcode or 1)
@@ -0,0 +1,41 @@
+import os
+import unittest
+from unittest.mock import patch
+
+# main creates its OpenAI client at import time
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+import main
+from main import plan_embedding_batches
+
+
+class TestPlanEmbeddingBatches(unittest.TestCase):
+    def test_every_text_is_planned_once(self):
+        texts = ["a" * length for length in (30, 5, 12, 1, 40, 7)]
+        batches = plan_embedding_batches(texts)
+        planned = sorted(index for batch in batches for index in batch)
+        self.assertEqual(planned, list(range(len(texts))))
+
+    def test_empty_input_has_no_batches(self):
+        self.assertEqual(plan_embedding_batches([]), [])
+
+    def test_batches_respect_input_limit_and_pack_by_length(self):
+        texts = ["aaaa", "a", "aa"]
+        with patch.object(main, "EMBEDDING_BATCH_SIZE", 2):
+            batches = plan_embedding_batches(texts)
+        self.assertEqual(batches, [[1, 2], [0]])
+
+    def test_batches_respect_token_limit(self):
+        texts = ["a" * 8] * 3  # 3 estimated tokens each
+        with patch.object(main, "EMBEDDING_BATCH_TOKENS", 5):
+            batches = plan_embedding_batches(texts)
+        self.assertEqual(len(batches), 3)
+
+    def test_oversized_text_still_gets_a_batch(self):
+        with patch.object(main, "EMBEDDING_BATCH_TOKENS", 1):
+            batches = plan_embedding_batches(["a" * 100])
+        self.assertEqual(batches, [[0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
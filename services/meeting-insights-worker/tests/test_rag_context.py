@@ -0,0 +1,53 @@
+import os
+import unittest
+from unittest.mock import patch
+
+# rag_api creates its OpenAI client at import time
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+import rag_api
+from rag_api import fit_chunks_to_budget
+from shared_models.rag import Chunk
+
+
+def make_chunk(chunk_id, text, similarity=0.9):
+    return Chunk(
+        id=chunk_id,
+        meeting_id=1,
+        meeting_native_id="abc-defg-hij",
+        platform="google_meet",
+        speaker="Анна",
+        text=text,
+        start_time=None,
+        end_time=None,
+        timestamp=None,
+        chunk_type="transcript",
+        language="ru",
+        topics=None,
+        similarity_score=similarity,
+    )
+
+
+class TestFitChunksToBudget(unittest.TestCase):
+    def test_stops_before_budget_is_exceeded(self):
+        chunks = [make_chunk(i, "a" * 20) for i in range(3)]  # 6 estimated tokens each
+        with patch.object(rag_api, "RAG_CONTEXT_TOKEN_BUDGET", 12):
+            fitted = fit_chunks_to_budget(chunks)
+        self.assertEqual([chunk.id for chunk in fitted], [0, 1])
+
+    def test_keeps_order(self):
+        chunks = [make_chunk(i, "short", similarity=1 - i / 10) for i in range(4)]
+        self.assertEqual(fit_chunks_to_budget(chunks), chunks)
+
+    def test_keeps_at_least_one_chunk(self):
+        chunks = [make_chunk(0, "a" * 1000), make_chunk(1, "a")]
+        with patch.object(rag_api, "RAG_CONTEXT_TOKEN_BUDGET", 10):
+            fitted = fit_chunks_to_budget(chunks)
+        self.assertEqual([chunk.id for chunk in fitted], [0])
+
+    def test_empty_input(self):
+        self.assertEqual(fit_chunks_to_budget([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()